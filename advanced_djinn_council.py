@@ -18,7 +18,7 @@ import logging
 import hashlib
 import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, List, Optional, Any, Tuple, Union, Callable
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from enum import Enum
@@ -191,6 +191,57 @@ class IntegritySafeguards:
         
         return sanitized.strip()
 
+class BackgroundWorker:
+    """Single persistent daemon thread that runs submitted calls one at a time.
+    
+    Used like a one-worker ThreadPoolExecutor, but the thread is a daemon, so it is not
+    joined at interpreter exit and a model call still running never blocks shutdown.
+    """
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.job_queue = Queue()
+        self.running = True
+        self.worker_thread = threading.Thread(target=self._worker_loop, name=name, daemon=True)
+        self.worker_thread.start()
+    
+    def submit(self, fn: Callable, *args) -> Future:
+        """Queue fn(*args) for the worker thread and return a Future for its result"""
+        if not self.running:
+            raise RuntimeError(f"Worker {self.name} is shut down")
+        future = Future()
+        self.job_queue.put((future, fn, args))
+        return future
+    
+    def shutdown(self):
+        """Cancel queued calls and stop the thread once the running call (if any) returns"""
+        self.running = False
+        while True:
+            try:
+                job = self.job_queue.get_nowait()
+            except Empty:
+                break
+            if job is not None:
+                job[0].cancel()
+        self.job_queue.put(None)  # Sentinel to stop worker
+    
+    def _worker_loop(self):
+        """Main worker loop - resolves each queued future with its call's outcome"""
+        while True:
+            job = self.job_queue.get()
+            if job is None:  # Sentinel to stop
+                break
+            
+            future, fn, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
 class DjinnWorker:
     """Persistent worker thread for efficient model execution"""
     
@@ -201,6 +252,14 @@ class DjinnWorker:
         self.worker_thread = None
         self.running = False
         self.model_loaded = False
+        
+        # Per-role request parts are fixed for the worker's lifetime - build them once
+        self.system_message = {"role": "system", "content": djinn_role.system_prompt}
+        self.chat_options = {
+            "timeout": 0,  # Disable timeout completely
+            "num_predict": -1,  # Allow unlimited response length
+        }
+        self.is_deepseek = "deepseek" in djinn_role.model_name.lower()
     
     def start(self):
         """Start the worker thread"""
@@ -227,8 +286,11 @@ class DjinnWorker:
                 if request is None:  # Sentinel to stop
                     break
                 
-                request_id, user_input, conversational_context = request
-                response = self._execute_djinn(user_input, conversational_context)
+                request_id, user_input, conversational_context, on_token, on_response = request
+                response = self._execute_djinn(user_input, conversational_context, on_token)
+                # Notify before handing the result back, so callers never see the session finish first
+                if on_response:
+                    self._notify(on_response, response)
                 self.response_queue.put((request_id, response))
                 
             except Empty:
@@ -237,8 +299,16 @@ class DjinnWorker:
                 logger.error(f"Worker error for {self.djinn_role.name}: {e}")
                 self.response_queue.put((request_id, None))
     
-    def _execute_djinn(self, user_input: str, conversational_context: str) -> DjinnResponse:
-        """Execute the djinn model with full conversational context"""
+    def _notify(self, callback: Callable, *args):
+        """Run a caller-supplied callback; its failures are logged and never affect the worker's result"""
+        try:
+            callback(*args)
+        except Exception as e:
+            logger.error(f"Callback error for {self.djinn_role.name}: {e}")
+    
+    def _execute_djinn(self, user_input: str, conversational_context: str,
+                       on_token: Optional[Callable[[str, str], None]] = None) -> DjinnResponse:
+        """Execute the djinn model with full conversational context, streaming tokens to on_token if given"""
         start_time = time.time()
         
         try:
@@ -248,25 +318,29 @@ class DjinnWorker:
             else:
                 full_input = user_input
             
+            messages = [self.system_message, {"role": "user", "content": full_input}]
+            options = self.chat_options
+            
             # Execute Ollama model with no timeout constraints
-            response = ollama.chat(
-                model=self.djinn_role.model_name,
-                messages=[
-                    {"role": "system", "content": self.djinn_role.system_prompt},
-                    {"role": "user", "content": full_input}
-                ],
-                options={
-                    "timeout": 0,  # Disable timeout completely
-                    "num_predict": -1,  # Allow unlimited response length
-                }
-            )
+            if on_token is None:
+                response = ollama.chat(model=self.djinn_role.model_name, messages=messages, options=options)
+                response_text = response['message']['content']
+            else:
+                # Stream partial output to the caller while accumulating the full reply
+                chunks = []
+                for part in ollama.chat(model=self.djinn_role.model_name, messages=messages,
+                                        options=options, stream=True):
+                    chunk = part['message']['content']
+                    if chunk:
+                        chunks.append(chunk)
+                        self._notify(on_token, self.djinn_role.role, chunk)
+                response_text = "".join(chunks)
             
             execution_time = time.time() - start_time
-            response_text = response['message']['content']
             
             # Special handling for deepseek models with thinking process
             thinking_content = ""
-            if "deepseek" in self.djinn_role.model_name.lower():
+            if self.is_deepseek:
                 thinking_content, response_text = self._extract_deepseek_thinking(response_text)
             
             # Extract confidence if model provides it
@@ -383,9 +457,11 @@ class DjinnWorker:
         else:
             return 0.7
     
-    def submit_request(self, request_id: str, user_input: str, conversational_context: str):
-        """Submit a request to the worker"""
-        self.request_queue.put((request_id, user_input, conversational_context))
+    def submit_request(self, request_id: str, user_input: str, conversational_context: str,
+                       on_token: Optional[Callable[[str, str], None]] = None,
+                       on_response: Optional[Callable[[DjinnResponse], None]] = None):
+        """Submit a request to the worker, optionally streaming tokens and reporting the finished response"""
+        self.request_queue.put((request_id, user_input, conversational_context, on_token, on_response))
     
     def get_response(self, timeout: Optional[float] = None) -> Optional[Tuple[str, DjinnResponse]]:
         """Get response from worker (no timeout = wait indefinitely)"""
@@ -775,9 +851,14 @@ class AdvancedDjinnCouncil:
             logger.error(f"Failed to log session: {e}")
     
     def invoke_council(self, user_input: str, consensus_mode: Optional[ConsensusMode] = None,
-                      timeout: Optional[float] = None) -> CouncilSession:
+                      timeout: Optional[float] = None,
+                      on_token: Optional[Callable[[str, str], None]] = None,
+                      on_response: Optional[Callable[[DjinnResponse], None]] = None) -> CouncilSession:
         """
         Main council invocation with full CISM implementation
+        
+        on_token(role, text) receives streamed output and on_response(response) each finished
+        djinn response, both from worker threads as they happen.
         """
         session_id = f"council_{int(time.time())}"
         start_time = time.time()
@@ -809,7 +890,7 @@ class AdvancedDjinnCouncil:
             # Submit requests to all workers with full conversational context
             request_id = f"req_{session_id}"
             for worker in self.djinn_workers.values():
-                worker.submit_request(request_id, user_input, conversational_context)
+                worker.submit_request(request_id, user_input, conversational_context, on_token, on_response)
             
             # Collect responses (no timeout - let models think as long as needed)
             djinn_responses = []
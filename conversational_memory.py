@@ -68,6 +68,9 @@ class ConversationalMemory:
         self.max_summary_topics = 10
         self.auto_summarize_threshold = 50  # Turns before auto-summarization
         
+        # Bumped on every change so callers can cache views of the memory
+        self.version = 0
+        
         # File paths
         self.conversation_file = self.memory_dir / f"{user_id}_conversation.jsonl"
         self.profile_file = self.memory_dir / f"{user_id}_profile.json"
@@ -157,6 +160,7 @@ class ConversationalMemory:
         
         # Add to memory
         self.conversation_history.append(turn)
+        self.version += 1
         
         # Update user profile based on this interaction
         self._update_user_profile(turn)
@@ -205,6 +209,7 @@ class ConversationalMemory:
             context_parts.append(f"Unresolved questions: {'; '.join(self.conversation_summary.unresolved_questions[-3:])}")
         
         # Recent conversation history
+        # Plain slice on purpose: include_recent_turns=0 has always meant the whole history
         recent_turns = self.conversation_history[-include_recent_turns:] if self.conversation_history else []
         
         if recent_turns:
@@ -427,15 +432,19 @@ class ConversationalMemory:
             self.conversation_history = recent_turns
             print(f"Auto-summarized old conversations, keeping {len(recent_turns)} recent turns")
     
-    def get_memory_stats(self) -> Dict[str, Any]:
-        """Get statistics about the memory system"""
+    def recent_turns(self, count: int) -> List[ConversationTurn]:
+        """The newest count turns, oldest first"""
+        return self.conversation_history[-count:] if count > 0 else []
+    
+    def get_memory_stats(self, topics_limit: Optional[int] = 10) -> Dict[str, Any]:
+        """Get statistics about the memory system, with at most topics_limit entries per topic list"""
         return {
             'total_turns': len(self.conversation_history),
             'user_since': self.user_profile.created_at.isoformat(),
             'last_interaction': self.user_profile.last_updated.isoformat(),
-            'common_topics': self.user_profile.common_topics[:10],
+            'common_topics': self.user_profile.common_topics[:topics_limit],
             'preferred_consensus': self.user_profile.preferred_consensus_mode,
-            'main_topics': self.conversation_summary.main_topics,
+            'main_topics': self.conversation_summary.main_topics[:topics_limit],
             'summary_turn_count': self.conversation_summary.turn_count,
             'memory_files': {
                 'conversation': str(self.conversation_file),
@@ -447,6 +456,7 @@ class ConversationalMemory:
     def clear_memory(self, keep_profile: bool = True):
         """Clear conversation memory (optionally keeping user profile)"""
         self.conversation_history = []
+        self.version += 1
         self.conversation_summary = ConversationSummary(
             main_topics=[], key_decisions=[], unresolved_questions=[],
             important_context=[], last_updated=datetime.now(), turn_count=0
@@ -14,51 +14,70 @@ Features:
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
-import threading
 import queue
 import json
+import os
 import time
 import subprocess
+import urllib.request
 import math
+import re
+import functools
 import random
-from datetime import datetime
+import contextlib
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
 # Import our advanced council
 from advanced_djinn_council import (
     AdvancedDjinnCouncil, DjinnRole, ConsensusMode, SecurityLevel,
-    CouncilState, DjinnResponse, ConsensusResult
+    CouncilState, DjinnResponse, ConsensusResult, BackgroundWorker
 )
 
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+
+_CONSENSUS_MODE_VALUES = tuple(mode.value for mode in ConsensusMode)
+_CONSENSUS_MODE_BY_VALUE = {mode.value: mode for mode in ConsensusMode}
+
 class OllamaModelManager:
     """Manages Ollama model detection and validation"""
     
     def __init__(self):
-        self.available_models = []
+        self.available_models = ()
+        self.available_model_set = frozenset()
         self.refresh_models()
     
     def refresh_models(self):
         """Refresh list of available Ollama models"""
+        models = self._fetch_models()
+        self.available_models = tuple(models)  # One tuple shared by every combobox
+        self.available_model_set = frozenset(models)
+    
+    def _fetch_models(self) -> List[str]:
+        """Fetch installed model names from the Ollama server, falling back to the CLI"""
+        try:
+            # Ask the Ollama server directly - avoids spawning the CLI
+            with urllib.request.urlopen(OLLAMA_TAGS_URL, timeout=2) as response:
+                data = json.load(response)
+            return [model['name'] for model in data.get('models', [])]
+        except Exception:
+            pass  # Server unreachable - fall back to the CLI
+        
         try:
             result = subprocess.run(['ollama', 'list'], 
                                   capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
                 lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                self.available_models = []
-                for line in lines:
-                    if line.strip():
-                        model_name = line.split()[0]  # First column is model name
-                        self.available_models.append(model_name)
-            else:
-                self.available_models = ['llama3.2:latest']  # Fallback
+                # First column is model name
+                return [line.split()[0] for line in lines if line.strip()]
         except Exception as e:
             print(f"Failed to get Ollama models: {e}")
-            self.available_models = ['llama3.2:latest']  # Fallback
+        
+        return ['llama3.2:latest']  # Fallback
     
     def is_model_available(self, model_name: str) -> bool:
         """Check if a specific model is available"""
-        return model_name in self.available_models
+        return model_name in self.available_model_set
 
 # DJINN ROLE DESCRIPTIONS AND MYSTICAL PROPERTIES
 DJINN_ROLE_DESCRIPTIONS = {
@@ -135,6 +154,54 @@ CONSENSUS_MODE_DESCRIPTIONS = {
     }
 }
 
+# Separator written after every chat history entry
+_CHAT_SEPARATOR = "\n" + "=" * 80 + "\n\n"
+
+# Model name fragments that indicate advanced thinking support
+_ADVANCED_THINKING_RE = re.compile(r'deepseek|o1|thinking|reasoning', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=32)
+def _is_advanced_thinking_model_name(model_name: str) -> bool:
+    """Check a model name against the advanced thinking patterns (memoized)"""
+    return _ADVANCED_THINKING_RE.search(model_name) is not None
+
+def _format_mmss(elapsed: float) -> str:
+    """Format elapsed seconds as a MM:SS timer string"""
+    minutes, seconds = divmod(int(elapsed), 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+def _format_hms_ms(timestamp) -> str:
+    """Format a datetime as HH:MM:SS.mmm without going through strftime"""
+    return (f"{timestamp.hour:02d}:{timestamp.minute:02d}:{timestamp.second:02d}"
+            f".{timestamp.microsecond // 1000:03d}")
+
+def _write_bytes_atomic(path: Path, data: bytes):
+    """Write data beside path, flush it to disk, then swap it in so a crash never leaves a truncated file"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(path)
+    except BaseException:
+        # Leave no half-written temp file behind
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+
+def _recent_turns_within_budget(turns: list, max_chars: int) -> list:
+    """Newest of the given turns (oldest first) whose query and response text fit within max_chars"""
+    recent = []
+    used = 0
+    for turn in reversed(turns):
+        used += len(turn.user_query) + len(turn.council_response)
+        if recent and used > max_chars:
+            break
+        recent.append(turn)
+    recent.reverse()
+    return recent
+
 class DjinnResponseWidget(tk.Frame):
     """🎭 Mystical widget for displaying individual djinn responses with ethereal aesthetics"""
     
@@ -144,7 +211,10 @@ class DjinnResponseWidget(tk.Frame):
         self.role = role
         self.position = position
         self.current_model = None
+        self.is_thinking_model = False
         self.thinking_animation_active = False
+        self.current_response = None
+        self.vote_callback = None  # Set by the main GUI
         
         # Get role info
         self.role_info = DJINN_ROLE_DESCRIPTIONS.get(role, {
@@ -443,9 +513,7 @@ class DjinnResponseWidget(tk.Frame):
             
         # Calculate elapsed time with mystical precision
         elapsed = time.time() - self.start_time
-        minutes = int(elapsed // 60)
-        seconds = int(elapsed % 60)
-        time_str = f"{minutes:02d}:{seconds:02d}"
+        time_str = _format_mmss(elapsed)
         
         # Update timer with color coding
         if elapsed < 30:
@@ -481,7 +549,7 @@ class DjinnResponseWidget(tk.Frame):
             current_pattern = self.thinking_patterns[message_index]
             
             # Add thinking insight to live content
-            timestamp = datetime.now().strftime('%H:%M:%S')
+            timestamp = time.strftime('%H:%M:%S')
             thinking_entry = f"[{timestamp}] {current_pattern}"
             self.live_thinking_content.append(thinking_entry)
             
@@ -567,14 +635,12 @@ class DjinnResponseWidget(tk.Frame):
     
     def _is_advanced_thinking_model(self) -> bool:
         """🧠 Check if current model supports advanced thinking patterns"""
-        if not self.current_model:
-            return False
-        model_lower = self.current_model.lower()
-        return any(pattern in model_lower for pattern in ['deepseek', 'o1', 'thinking', 'reasoning'])
+        return self.is_thinking_model
     
     def set_model(self, model_name: str):
         """Set the current model for this djinn"""
         self.current_model = model_name
+        self.is_thinking_model = bool(model_name) and _is_advanced_thinking_model_name(model_name)
     
     def set_response(self, response: DjinnResponse):
         """Update widget with djinn response"""
@@ -584,9 +650,7 @@ class DjinnResponseWidget(tk.Frame):
         # Calculate final thinking time
         if self.start_time:
             total_thinking_time = time.time() - self.start_time
-            minutes = int(total_thinking_time // 60)
-            seconds = int(total_thinking_time % 60)
-            final_time_str = f"{minutes:02d}:{seconds:02d}"
+            final_time_str = _format_mmss(total_thinking_time)
             self.timer_label.config(text=final_time_str, foreground='green')
         
         if response.response.startswith("[ERROR"):
@@ -605,23 +669,26 @@ class DjinnResponseWidget(tk.Frame):
         
         # Add thinking summary header
         if self.start_time:
-            thinking_summary = f"🧠 Thinking completed in {response.execution_time:.1f}s\n"
-            
+            parts = [f"🧠 Thinking completed in {response.execution_time:.1f}s\n"]
+
             # Check if this is a deepseek model with thinking content
             if response.metadata and response.metadata.get("has_thinking", False):
                 thinking_content = response.metadata.get("thinking_content", "")
                 model_name = response.metadata.get("model_name", "")
-                
-                thinking_summary += f"🤖 Model: {model_name}\n"
-                thinking_summary += f"🧠 Deep Thinking Process:\n"
-                thinking_summary += "-" * 40 + "\n"
-                thinking_summary += thinking_content[:500] + ("..." if len(thinking_content) > 500 else "")
-                thinking_summary += "\n" + "-" * 40 + "\n\n"
-                thinking_summary += f"💭 Final Response from {self.djinn_name}:\n"
+
+                parts.extend([
+                    f"🤖 Model: {model_name}\n",
+                    "🧠 Deep Thinking Process:\n",
+                    "-" * 40, "\n",
+                    thinking_content[:500], "..." if len(thinking_content) > 500 else "",
+                    "\n", "-" * 40, "\n\n",
+                    f"💭 Final Response from {self.djinn_name}:\n"
+                ])
             else:
-                thinking_summary += f"💭 Final response from {self.djinn_name}:\n"
-            
-            thinking_summary += "=" * 50 + "\n\n"
+                parts.append(f"💭 Final response from {self.djinn_name}:\n")
+
+            parts.append("=" * 50 + "\n\n")
+            thinking_summary = "".join(parts)
             self.response_text.insert(tk.END, thinking_summary)
         
         # Add actual response
@@ -640,13 +707,16 @@ class DjinnResponseWidget(tk.Frame):
     
     def vote_for_response(self):
         """Handle vote button click"""
-        # This would trigger a callback to the main GUI
-        if hasattr(self, 'vote_callback'):
+        # Nothing to vote for until a response has arrived
+        if self.vote_callback is not None and self.current_response is not None:
             self.vote_callback(self.current_response)
 
 class DjinnCouncilGUI:
     """🌌 MYSTICAL DJINN COUNCIL NEXUS - Supreme Orchestration Interface 🌌"""
     
+    # Character budget for restored history; the newest turn is always shown
+    HISTORY_CHAR_BUDGET = 32 * 1024
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("🌂 DJINN COUNCIL NEXUS - Mystical Multi-Agent Orchestration 🌂")
@@ -670,6 +740,10 @@ class DjinnCouncilGUI:
         self.djinn_widgets = {}
         self.response_queue = queue.Queue()
         
+        # Single persistent daemon worker for council invocations
+        self.council_worker = BackgroundWorker('council')
+        self.council_future = None
+        
         # Typewriter layout tracking
         self.djinn_positions = {}
         self.max_columns = 3  # 3 djinn per row in typewriter layout
@@ -746,6 +820,7 @@ class DjinnCouncilGUI:
         
         # Create model selection for each role
         self.model_vars = {}
+        self.model_combos = {}
         roles_frame = ttk.Frame(models_frame)
         roles_frame.pack(fill='x', pady=5)
         
@@ -765,6 +840,7 @@ class DjinnCouncilGUI:
                                       values=self.model_manager.available_models,
                                       width=20, state='readonly')
             model_combo.pack(side='left', padx=5)
+            self.model_combos[role] = model_combo
             
             # Set default value
             if role in self.current_config.get('model_assignments', {}):
@@ -780,7 +856,7 @@ class DjinnCouncilGUI:
         ttk.Label(controls_frame, text="Consensus Mode:").pack(side='left')
         self.consensus_var = tk.StringVar(value='weighted_roles')
         consensus_combo = ttk.Combobox(controls_frame, textvariable=self.consensus_var,
-                                      values=[mode.value for mode in ConsensusMode],
+                                      values=_CONSENSUS_MODE_VALUES,
                                       width=15, state='readonly')
         consensus_combo.pack(side='left', padx=5)
         
@@ -882,8 +958,9 @@ class DjinnCouncilGUI:
         self.responses_notebook.add(metrics_frame, text="Session Metrics")
         
         self.metrics_text = scrolledtext.ScrolledText(metrics_frame, wrap='word',
-                                                     font=('Consolas', 10))
+                                                     font=('Consolas', 10), state='disabled')
         self.metrics_text.pack(fill='both', expand=True, padx=5, pady=5)
+        self._last_metrics_hash = None
     
     def setup_status_bar(self):
         """Setup status bar"""
@@ -942,23 +1019,13 @@ class DjinnCouncilGUI:
     
     def refresh_models(self):
         """Refresh available Ollama models"""
+        previous_models = self.model_manager.available_models
         self.model_manager.refresh_models()
         
-        # Update all comboboxes
-        for role in self.model_vars:
-            combo_widget = None
-            for widget in self.root.winfo_children():
-                if isinstance(widget, ttk.PanedWindow):
-                    for child in widget.winfo_children():
-                        if isinstance(child, ttk.LabelFrame) and "Configuration" in child.cget("text"):
-                            # Find and update combobox
-                            for descendant in child.winfo_children():
-                                if isinstance(descendant, ttk.Frame):
-                                    for subchild in descendant.winfo_children():
-                                        if isinstance(subchild, ttk.Frame):
-                                            for combo in subchild.winfo_children():
-                                                if isinstance(combo, ttk.Combobox) and combo.cget('textvariable') == str(self.model_vars[role]):
-                                                    combo.configure(values=self.model_manager.available_models)
+        # Update all comboboxes only when the list actually changed
+        if self.model_manager.available_models != previous_models:
+            for combo in self.model_combos.values():
+                combo.configure(values=self.model_manager.available_models)
         
         self.status_var.set(f"Found {len(self.model_manager.available_models)} Ollama models")
     
@@ -969,10 +1036,11 @@ class DjinnCouncilGUI:
         
         try:
             # Update djinn roles with selected models
+            available = self.model_manager.available_model_set
             for role_key, model_var in self.model_vars.items():
                 if role_key in self.council.djinn_roles:
                     selected_model = model_var.get()
-                    if selected_model and self.model_manager.is_model_available(selected_model):
+                    if selected_model and selected_model in available:
                         self.council.djinn_roles[role_key].model_name = selected_model
                         
                         # Update the widget with the model information
@@ -1045,6 +1113,16 @@ class DjinnCouncilGUI:
             messagebox.showerror("Council Error", "Council not initialized.")
             return
         
+        # One invocation at a time - ignore submits while the council is still deliberating
+        if self.council_future is not None and not self.council_future.done():
+            return
+        
+        # Resolve the consensus mode before touching any UI state - Tk variables belong to the main thread
+        consensus_mode = _CONSENSUS_MODE_BY_VALUE.get(self.consensus_var.get())
+        if consensus_mode is None:
+            messagebox.showerror("Consensus Error", f"Unknown consensus mode: {self.consensus_var.get()}")
+            return
+        
         # Disable submit button and start mystical progress
         self.submit_button.config(state='disabled', bg='#374151')
         self._start_mystical_progress()
@@ -1057,15 +1135,12 @@ class DjinnCouncilGUI:
         # Add query to chat history
         self.add_to_chat_history(f"🤔 Your Query: {query}\n", 'user')
         
-        # Start council invocation in separate thread
-        threading.Thread(target=self._invoke_council_thread, args=(query,), daemon=True).start()
+        # Run council invocation on the persistent worker
+        self.council_future = self.council_worker.submit(self._invoke_council_thread, query, consensus_mode)
     
-    def _invoke_council_thread(self, query: str):
-        """Thread function for council invocation"""
+    def _invoke_council_thread(self, query: str, consensus_mode: ConsensusMode):
+        """Worker function for council invocation"""
         try:
-            # Get consensus mode
-            consensus_mode = ConsensusMode(self.consensus_var.get())
-            
             # Invoke council (no timeout - let models think as long as needed)
             session = self.council.invoke_council(query, consensus_mode, timeout=None)
             
@@ -1106,8 +1181,7 @@ class DjinnCouncilGUI:
         
         # Update consensus result
         if session.consensus_result:
-            self.consensus_text.delete(1.0, tk.END)
-            self.consensus_text.insert(tk.END, session.consensus_result.final_response)
+            self.consensus_text.replace('1.0', tk.END, session.consensus_result.final_response)
             
             # Add to chat history
             self.add_to_chat_history(f"🜂 Council Decision:\n{session.consensus_result.final_response}\n\n", 'council')
@@ -1137,7 +1211,7 @@ class DjinnCouncilGUI:
     
     def update_metrics_display(self, session):
         """Update metrics display"""
-        metrics_text = f"""Session Metrics
+        parts = [f"""Session Metrics
 ================
 
 Session ID: {session.session_id}
@@ -1148,38 +1222,38 @@ Divergence Score: {session.consensus_result.divergence_score:.2f}
 Recursion Depth: {session.recursion_depth}
 
 Individual Response Times:
-"""
+"""]
         
-        for response in session.djinn_responses:
-            metrics_text += f"  {response.djinn_name}: {response.execution_time:.2f}s (confidence: {response.confidence_score:.2f})\n"
+        parts.extend(f"  {response.djinn_name}: {response.execution_time:.2f}s (confidence: {response.confidence_score:.2f})\n"
+                     for response in session.djinn_responses)
         
         if session.security_events:
-            metrics_text += f"\nSecurity Events:\n"
-            for event in session.security_events:
-                metrics_text += f"  - {event}\n"
+            parts.append("\nSecurity Events:\n")
+            parts.extend(f"  - {event}\n" for event in session.security_events)
         
-        metrics_text += f"\nState Transitions:\n"
-        for state, timestamp in session.state_history:
-            metrics_text += f"  {state.value}: {timestamp.strftime('%H:%M:%S.%f')[:-3]}\n"
+        parts.append("\nState Transitions:\n")
+        parts.extend(f"  {state.value}: {_format_hms_ms(timestamp)}\n"
+                     for state, timestamp in session.state_history)
         
-        self.metrics_text.delete(1.0, tk.END)
-        self.metrics_text.insert(tk.END, metrics_text)
+        metrics_text = "".join(parts)
+        
+        # Skip the rewrite when the metrics are unchanged
+        metrics_hash = hash(metrics_text)
+        if metrics_hash == self._last_metrics_hash:
+            return
+        self.metrics_text.config(state='normal')
+        self.metrics_text.replace('1.0', tk.END, metrics_text)
+        self.metrics_text.config(state='disabled')
+        self._last_metrics_hash = metrics_hash
     
     def add_to_chat_history(self, text: str, sender: str):
         """Add text to chat history with formatting"""
         self.chat_history.config(state='normal')
         
-        # Add timestamp
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.chat_history.insert(tk.END, f"[{timestamp}] ")
-        
-        # Add text with color coding
-        if sender == 'user':
-            self.chat_history.insert(tk.END, text)
-        elif sender == 'council':
-            self.chat_history.insert(tk.END, text)
-        
-        self.chat_history.insert(tk.END, "\n" + "="*80 + "\n\n")
+        # Timestamp, text and separator land in a single insert
+        timestamp = time.strftime('%H:%M:%S')
+        body = text if sender in ('user', 'council') else ""
+        self.chat_history.insert(tk.END, f"[{timestamp}] {body}{_CHAT_SEPARATOR}")
         self.chat_history.see(tk.END)
         self.chat_history.config(state='disabled')
     
@@ -1188,8 +1262,7 @@ Individual Response Times:
         # Override consensus with voted response
         vote_text = f"👍 MANUAL OVERRIDE - Selected {response.djinn_name}'s Response:\n\n{response.response}"
         
-        self.consensus_text.delete(1.0, tk.END)
-        self.consensus_text.insert(tk.END, vote_text)
+        self.consensus_text.replace('1.0', tk.END, vote_text)
         
         self.add_to_chat_history(f"👍 You selected {response.djinn_name}'s response as the final decision.\n", 'user')
         
@@ -1198,12 +1271,12 @@ Individual Response Times:
     
     def load_config(self) -> Dict[str, Any]:
         """Load GUI configuration"""
-        if Path(self.config_file).exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Failed to load config: {e}")
+        try:
+            return json.loads(Path(self.config_file).read_bytes())
+        except FileNotFoundError:
+            pass  # First run - use the defaults
+        except (OSError, ValueError) as e:
+            print(f"Failed to load config: {e}")
         
         return {
             'model_assignments': {},
@@ -1220,8 +1293,7 @@ Individual Response Times:
         }
         
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            _write_bytes_atomic(Path(self.config_file), json.dumps(config, indent=2).encode())
             self.status_var.set("Configuration saved successfully")
             messagebox.showinfo("Config Saved", f"Configuration saved to {self.config_file}")
         except Exception as e:
@@ -1236,16 +1308,20 @@ Individual Response Times:
         
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    config = json.load(f)
+                config = json.loads(Path(file_path).read_bytes())
                 
-                # Apply loaded configuration
+                # Apply loaded configuration (only touch variables that change)
                 for role, model in config.get('model_assignments', {}).items():
-                    if role in self.model_vars:
-                        self.model_vars[role].set(model)
+                    var = self.model_vars.get(role)
+                    if var is not None and var.get() != model:
+                        var.set(model)
                 
-                if 'consensus_mode' in config:
-                    self.consensus_var.set(config['consensus_mode'])
+                consensus_mode = config.get('consensus_mode')
+                if consensus_mode is not None and consensus_mode not in _CONSENSUS_MODE_BY_VALUE:
+                    messagebox.showwarning("Unknown Consensus Mode",
+                                           f"Ignoring unknown consensus mode '{consensus_mode}' in configuration")
+                elif consensus_mode is not None and self.consensus_var.get() != consensus_mode:
+                    self.consensus_var.set(consensus_mode)
                 
                 self.current_config = config
                 self.status_var.set(f"Configuration loaded from {Path(file_path).name}")
@@ -1259,22 +1335,24 @@ Individual Response Times:
         if not self.council or not self.council.conversational_memory:
             return
         
-        # Get recent conversation history
-        recent_turns = self.council.conversational_memory.conversation_history[-10:]  # Last 10 turns
+        # Get recent conversation history - last 10 turns, fewer if they are very long
+        recent_turns = _recent_turns_within_budget(self.council.conversational_memory.recent_turns(10),
+                                                   self.HISTORY_CHAR_BUDGET)
         
         if recent_turns:
-            self.chat_history.config(state='normal')
-            self.chat_history.insert(tk.END, "=== Previous Conversation History ===\n\n")
+            # Build the whole history block so it lands in a single insert
+            lines = ["=== Previous Conversation History ===\n\n"]
+            lines.extend(
+                f"[{turn.timestamp:%Y-%m-%d %H:%M:%S}]\n"
+                f"🤔 Your Query: {turn.user_query}\n"
+                f"🜂 Council Decision: {turn.council_response}\n\n"
+                f"{'-' * 80}\n\n"
+                for turn in recent_turns
+            )
+            lines.append("=== Current Session ===\n\n")
             
-            for turn in recent_turns:
-                # Format timestamp
-                time_str = turn.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                self.chat_history.insert(tk.END, f"[{time_str}]\n")
-                self.chat_history.insert(tk.END, f"🤔 Your Query: {turn.user_query}\n")
-                self.chat_history.insert(tk.END, f"🜂 Council Decision: {turn.council_response}\n\n")
-                self.chat_history.insert(tk.END, "-" * 80 + "\n\n")
-            
-            self.chat_history.insert(tk.END, "=== Current Session ===\n\n")
+            self.chat_history.config(state='normal')
+            self.chat_history.insert(tk.END, "".join(lines))
             self.chat_history.see(tk.END)
             self.chat_history.config(state='disabled')
     
@@ -1284,7 +1362,7 @@ Individual Response Times:
             messagebox.showwarning("No Council", "Council not initialized.")
             return
         
-        memory_stats = self.council.conversational_memory.get_memory_stats()
+        memory_stats = self.council.conversational_memory.get_memory_stats(topics_limit=5)
         
         stats_text = f"""🧠 Conversational Memory Statistics
 
@@ -1296,10 +1374,10 @@ Individual Response Times:
 
 🎯 User Profile:
 • Preferred consensus: {memory_stats['preferred_consensus']}
-• Common topics: {', '.join(memory_stats['common_topics'][:5])}
+• Common topics: {', '.join(memory_stats['common_topics'])}
 
 💭 Current Context:
-• Main discussion topics: {', '.join(memory_stats['main_topics'][:5])}
+• Main discussion topics: {', '.join(memory_stats['main_topics'])}
 
 📁 Memory Files:
 • Conversation: {memory_stats['memory_files']['conversation']}
@@ -1348,6 +1426,7 @@ Individual Response Times:
         try:
             self.root.mainloop()
         finally:
+            self.council_worker.shutdown()
             if self.council:
                 self.council.shutdown()
 
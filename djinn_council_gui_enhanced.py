@@ -14,51 +14,91 @@ Features:
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
+import tkinter.font as tkfont
+import concurrent.futures
 import threading
 import queue
 import json
+import os
+import hashlib
 import time
 import subprocess
+import urllib.request
 import math
-import random
-from datetime import datetime
+import re
+import functools
+import itertools
+import contextlib
+import copy
+from collections import deque
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
 # Import our advanced council
 from advanced_djinn_council import (
     AdvancedDjinnCouncil, DjinnRole, ConsensusMode, SecurityLevel,
-    CouncilState, DjinnResponse, ConsensusResult
+    CouncilState, DjinnResponse, ConsensusResult, BackgroundWorker
 )
 
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+
+_CONSENSUS_MODE_VALUES = tuple(mode.value for mode in ConsensusMode)
+_CONSENSUS_MODE_BY_VALUE = {mode.value: mode for mode in ConsensusMode}
+
+class ResponseQueue(queue.Queue):
+    """Queue whose consumer can take a whole batch of messages under one lock"""
+    
+    def drain(self, max_items: int) -> List[tuple]:
+        """Remove and return up to max_items queued messages without blocking"""
+        with self.mutex:
+            count = min(max_items, len(self.queue))
+            items = [self.queue.popleft() for _ in range(count)]
+            if items:
+                self.not_full.notify_all()
+            return items
+
 class OllamaModelManager:
     """Manages Ollama model detection and validation"""
     
     def __init__(self):
-        self.available_models = []
+        self.available_models = ()
+        self.available_model_set = frozenset()
         self.refresh_models()
     
     def refresh_models(self):
         """Refresh list of available Ollama models"""
+        self.set_models(self.fetch_models())
+    
+    def set_models(self, models: List[str]):
+        """Install a fetched model list as one tuple shared by every combobox"""
+        self.available_models = tuple(models)
+        self.available_model_set = frozenset(models)
+    
+    def fetch_models(self) -> List[str]:
+        """Fetch installed model names from the Ollama server, falling back to the CLI"""
+        try:
+            # Ask the Ollama server directly - avoids spawning the CLI
+            with urllib.request.urlopen(OLLAMA_TAGS_URL, timeout=2) as response:
+                data = json.load(response)
+            return [model['name'] for model in data.get('models', [])]
+        except Exception:
+            pass  # Server unreachable - fall back to the CLI
+        
         try:
             result = subprocess.run(['ollama', 'list'], 
                                   capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
                 lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                self.available_models = []
-                for line in lines:
-                    if line.strip():
-                        model_name = line.split()[0]  # First column is model name
-                        self.available_models.append(model_name)
-            else:
-                self.available_models = ['llama3.2:latest']  # Fallback
+                # First column is model name
+                return [line.split()[0] for line in lines if line.strip()]
         except Exception as e:
             print(f"Failed to get Ollama models: {e}")
-            self.available_models = ['llama3.2:latest']  # Fallback
+        
+        return ['llama3.2:latest']  # Fallback
     
     def is_model_available(self, model_name: str) -> bool:
         """Check if a specific model is available"""
-        return model_name in self.available_models
+        return model_name in self.available_model_set
 
 # DJINN ROLE DESCRIPTIONS AND MYSTICAL PROPERTIES
 DJINN_ROLE_DESCRIPTIONS = {
@@ -135,17 +175,208 @@ CONSENSUS_MODE_DESCRIPTIONS = {
     }
 }
 
+# Pre-baked (title, full description) shown for each consensus mode
+_CONSENSUS_DISPLAY = {
+    mode: (info['title'], f"{info['description']} {info['details']}")
+    for mode, info in CONSENSUS_MODE_DESCRIPTIONS.items()
+}
+
+# ROLE-SPECIFIC THINKING PATTERNS SHOWN WHILE DJINN CONTEMPLATE
+DJINN_THINKING_PATTERNS = {
+    'strategist': (
+        "🔮 Peering into possible futures...",
+        "⏳ Analyzing temporal implications...",
+        "🌀 Mapping recursive consequences...",
+        "🎯 Identifying strategic leverage points...",
+        "🧭 Charting the optimal path forward...",
+        "⚡ Synthesizing long-term vision..."
+    ),
+    'analyst': (
+        "📊 Decomposing problem structure...",
+        "🔬 Examining data patterns...",
+        "⚗️ Distilling key insights...",
+        "📐 Calculating statistical significance...",
+        "🎯 Identifying critical variables...",
+        "🧮 Performing analytical synthesis..."
+    ),
+    'arbiter': (
+        "⚖️ Weighing all perspectives...",
+        "👑 Considering cosmic justice...",
+        "🔍 Examining conflicting viewpoints...",
+        "💎 Seeking balanced judgment...",
+        "🎭 Evaluating moral implications...",
+        "⚡ Preparing final arbitration..."
+    ),
+    'guardian': (
+        "🛡️ Scanning for vulnerabilities...",
+        "🔒 Assessing security implications...",
+        "⚠️ Identifying potential risks...",
+        "🚨 Evaluating threat vectors...",
+        "🔐 Fortifying protective measures...",
+        "⚔️ Preparing defensive strategies..."
+    ),
+    'architect': (
+        "🏗️ Designing system architecture...",
+        "📐 Crafting structural blueprints...",
+        "🔧 Engineering elegant solutions...",
+        "🏛️ Building conceptual frameworks...",
+        "⚙️ Optimizing component integration...",
+        "🎨 Perfecting systematic beauty..."
+    ),
+    'historian': (
+        "📚 Consulting ancient wisdom...",
+        "📜 Reviewing historical precedents...",
+        "🕰️ Tracing patterns through time...",
+        "🔍 Uncovering relevant parallels...",
+        "💭 Drawing from collective memory...",
+        "✨ Illuminating with past insights..."
+    )
+}
+
+DEFAULT_THINKING_PATTERNS = (
+    "🌟 Processing mystical insights...",
+    "✨ Channeling cosmic wisdom...",
+    "🔮 Divining optimal solutions..."
+)
+
+# ROLE-SPECIFIC INSIGHTS REVEALED DURING LONG CONTEMPLATION
+DJINN_MYSTICAL_INSIGHTS = {
+    'strategist': (
+        "Multiple timeline convergences detected",
+        "Long-term stability patterns emerging", 
+        "Strategic leverage points crystallizing",
+        "Future-state probability matrices stabilizing"
+    ),
+    'analyst': (
+        "Data correlation patterns strengthening",
+        "Statistical significance thresholds reached",
+        "Critical variable interactions identified",
+        "Analytical framework coherence achieved"
+    ),
+    'arbiter': (
+        "Moral weight calculations balancing",
+        "Justice algorithms reaching equilibrium",
+        "Ethical framework synthesis completing",
+        "Wisdom-based decision tree optimizing"
+    ),
+    'guardian': (
+        "Threat assessment matrices stabilizing",
+        "Security perimeter analysis deepening",
+        "Risk mitigation strategies crystallizing",
+        "Protective protocol optimization active"
+    ),
+    'architect': (
+        "System design blueprints crystallizing",
+        "Architectural pattern recognition active",
+        "Framework integration points solidifying",
+        "Structural optimization algorithms running"
+    ),
+    'historian': (
+        "Historical pattern matching intensifying",
+        "Precedent correlation analysis deepening",
+        "Temporal context synthesis strengthening",
+        "Wisdom archive synchronization active"
+    )
+}
+
+DEFAULT_MYSTICAL_INSIGHTS = ("Cosmic wisdom channels opening",)
+
+# 256-step sine table for the progress orb bobbing
+_SIN_LUT_SIZE = 256
+_SIN_LUT = tuple(math.sin(2 * math.pi * i / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE))
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
+
+# Sine pulse intensity (0..1) for each of the 60 symbol animation frames
+_PULSE_INTENSITY = tuple((math.sin(frame * 0.2) + 1) / 2 for frame in range(60))
+
+# Sparkle positions on the confidence crystal - above 0.8 confidence the fill always covers all three
+_SPARKLE_POSITIONS = ((7, 5), (30, 9), (50, 6))
+
+# Banner rules used in djinn thinking and revelation text
+_BANNER_EQ50 = "=" * 50
+_BANNER_EQ60 = "=" * 60
+_BANNER_DASH50 = "-" * 50
+_BANNER_BOX50 = "─" * 50
+_BANNER_BOX60 = "─" * 60
+
+# Separator written after every chat history entry
+_CHAT_SEPARATOR = "\n" + "=" * 80 + "\n\n"
+
 # Removed annoying tooltip class - info now displayed directly in GUI
 
+# Model name fragments that indicate advanced thinking support
+_ADVANCED_THINKING_RE = re.compile(r'deepseek|o1|thinking|reasoning', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=32)
+def _is_advanced_thinking_model_name(model_name: str) -> bool:
+    """Check a model name against the advanced thinking patterns (memoized)"""
+    return _ADVANCED_THINKING_RE.search(model_name) is not None
+
+def _format_mmss(elapsed: float) -> str:
+    """Format elapsed seconds as a MM:SS timer string"""
+    minutes, seconds = divmod(int(elapsed), 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+def _format_hms_ms(timestamp) -> str:
+    """Format a datetime as HH:MM:SS.mmm without going through strftime"""
+    return (f"{timestamp.hour:02d}:{timestamp.minute:02d}:{timestamp.second:02d}"
+            f".{timestamp.microsecond // 1000:03d}")
+
+def _write_bytes_atomic(path: Path, data: bytes):
+    """Write data beside path, flush it to disk, then swap it in so a crash never leaves a truncated file"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(path)
+    except BaseException:
+        # Leave no half-written temp file behind
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+
+def _recent_turns_within_budget(turns: list, max_chars: int) -> list:
+    """Newest of the given turns (oldest first) whose query and response text fit within max_chars"""
+    recent = []
+    used = 0
+    for turn in reversed(turns):
+        used += len(turn.user_query) + len(turn.council_response)
+        if recent and used > max_chars:
+            break
+        recent.append(turn)
+    recent.reverse()
+    return recent
+
+def _ensure_djinn_styles(master: tk.Misc):
+    """Configure the Djinn.* label styles for the current ttk theme if they are not set up yet"""
+    style = ttk.Style(master)
+    if style.lookup('Djinn.Name.TLabel', 'foreground'):
+        return
+    style.configure('Djinn.Name.TLabel', background='#0f0f23', foreground='#e6e6fa', font=('Arial', 11, 'bold'))
+    style.configure('Djinn.Role.TLabel', background='#0f0f23', foreground='#b0b0b0', font=('Arial', 8))
+    style.configure('Djinn.Crystal.TLabel', background='#1a1a2e', foreground='#cccccc', font=('Arial', 8))
+    style.configure('Djinn.CrystalValue.TLabel', background='#1a1a2e', foreground='#00ff88', font=('JetBrains Mono', 8))
+    style.configure('Djinn.Time.TLabel', background='#1a1a2e', foreground='#888888', font=('Arial', 8))
+
 class DjinnResponseWidget(tk.Frame):
     """🎭 Mystical widget for displaying individual djinn responses with ethereal aesthetics"""
     
+    # Live thinking entries kept for the contemplation summary
+    LIVE_SUMMARY_ENTRIES = 5
+    
+    # Thinking log is trimmed back to KEEP lines once it exceeds MAX lines
+    MAX_THINKING_LINES = 500
+    KEEP_THINKING_LINES = 400
+    
     def __init__(self, parent, djinn_name: str, role: str, position: tuple = (0, 0)):
         super().__init__(parent, bg='#1a1a2e', relief='raised', bd=2)
         self.djinn_name = djinn_name
         self.role = role
         self.position = position
         self.current_model = None
+        self.is_thinking_model = False
         self.thinking_animation_active = False
         
         # Get role info
@@ -157,83 +388,39 @@ class DjinnResponseWidget(tk.Frame):
         
         # Timer and status tracking
         self.start_time = None
-        self.timer_job = None
         self.animation_job = None
+        self._last_timer_second = None
+        self._thinking_stage = None
+        self._timer_color = None
+        self._last_thinking_phase = 0
         self.current_thinking_text = ""
-        self.live_thinking_content = []
+        self.live_thinking_content = deque(maxlen=self.LIVE_SUMMARY_ENTRIES)
         
         # Thinking patterns - more mystical and role-specific
-        self.thinking_patterns = self._get_role_thinking_patterns()
+        self.thinking_patterns = DJINN_THINKING_PATTERNS.get(role, DEFAULT_THINKING_PATTERNS)
         self.current_thinking_index = 0
         
         # Visual state
         self.is_thinking = False
+        self.is_streaming = False
+        self.current_response = None
+        self.vote_callback = None  # Set by the main GUI
         self.pulse_state = 0
+        self.symbol_color = self.role_info['color']
+        
+        # Symbol color for every pulse frame: bright flash, normal color or dimmed
+        self.pulse_colors = tuple(
+            '#ffffff' if intensity > 0.7 else self.role_info['color'] if intensity > 0.4 else '#666666'
+            for intensity in _PULSE_INTENSITY
+        )
         
         # Create mystical widget layout
         self.setup_mystical_widget()
     
-    def _get_role_thinking_patterns(self):
-        """Get role-specific thinking patterns"""
-        patterns = {
-            'strategist': [
-                "🔮 Peering into possible futures...",
-                "⏳ Analyzing temporal implications...",
-                "🌀 Mapping recursive consequences...",
-                "🎯 Identifying strategic leverage points...",
-                "🧭 Charting the optimal path forward...",
-                "⚡ Synthesizing long-term vision..."
-            ],
-            'analyst': [
-                "📊 Decomposing problem structure...",
-                "🔬 Examining data patterns...",
-                "⚗️ Distilling key insights...",
-                "📐 Calculating statistical significance...",
-                "🎯 Identifying critical variables...",
-                "🧮 Performing analytical synthesis..."
-            ],
-            'arbiter': [
-                "⚖️ Weighing all perspectives...",
-                "👑 Considering cosmic justice...",
-                "🔍 Examining conflicting viewpoints...",
-                "💎 Seeking balanced judgment...",
-                "🎭 Evaluating moral implications...",
-                "⚡ Preparing final arbitration..."
-            ],
-            'guardian': [
-                "🛡️ Scanning for vulnerabilities...",
-                "🔒 Assessing security implications...",
-                "⚠️ Identifying potential risks...",
-                "🚨 Evaluating threat vectors...",
-                "🔐 Fortifying protective measures...",
-                "⚔️ Preparing defensive strategies..."
-            ],
-            'architect': [
-                "🏗️ Designing system architecture...",
-                "📐 Crafting structural blueprints...",
-                "🔧 Engineering elegant solutions...",
-                "🏛️ Building conceptual frameworks...",
-                "⚙️ Optimizing component integration...",
-                "🎨 Perfecting systematic beauty..."
-            ],
-            'historian': [
-                "📚 Consulting ancient wisdom...",
-                "📜 Reviewing historical precedents...",
-                "🕰️ Tracing patterns through time...",
-                "🔍 Uncovering relevant parallels...",
-                "💭 Drawing from collective memory...",
-                "✨ Illuminating with past insights..."
-            ]
-        }
-        return patterns.get(self.role, [
-            "🌟 Processing mystical insights...",
-            "✨ Channeling cosmic wisdom...",
-            "🔮 Divining optimal solutions..."
-        ])
-    
     def setup_mystical_widget(self):
         """🎨 Setup the mystical visual layout with ethereal aesthetics"""
         self.configure(width=350, height=400)
+        _ensure_djinn_styles(self)
         
         # Mystical header with role symbol and glow effect
         header_frame = tk.Frame(self, bg='#0f0f23', relief='groove', bd=1)
@@ -250,18 +437,10 @@ class DjinnResponseWidget(tk.Frame):
                                     fg=self.role_info['color'])
         self.symbol_label.pack(side='left')
         
-        self.name_label = tk.Label(symbol_name_frame, 
-                                  text=f"{self.djinn_name}", 
-                                  font=('Arial', 11, 'bold'), 
-                                  bg='#0f0f23', 
-                                  fg='#e6e6fa')
+        self.name_label = ttk.Label(symbol_name_frame, text=f"{self.djinn_name}", style='Djinn.Name.TLabel')
         self.name_label.pack(side='left', padx=(8, 0))
         
-        self.role_label = tk.Label(symbol_name_frame, 
-                                  text=self.role_info['title'], 
-                                  font=('Arial', 8), 
-                                  bg='#0f0f23', 
-                                  fg='#b0b0b0')
+        self.role_label = ttk.Label(symbol_name_frame, text=self.role_info['title'], style='Djinn.Role.TLabel')
         self.role_label.pack(side='left', padx=(5, 0))
         
         # Status and timer with mystical indicators
@@ -275,8 +454,9 @@ class DjinnResponseWidget(tk.Frame):
                                     fg='#888888')
         self.status_label.pack(side='left')
         
+        self.timer_var = tk.StringVar(value="00:00")
         self.timer_label = tk.Label(status_frame, 
-                                   text="00:00", 
+                                   textvariable=self.timer_var, 
                                    font=('JetBrains Mono', 9, 'bold'), 
                                    bg='#0f0f23', 
                                    fg='#00ff88')
@@ -287,17 +467,26 @@ class DjinnResponseWidget(tk.Frame):
         crystal_frame.pack(fill='x', padx=5, pady=2)
         crystal_frame.pack_propagate(False)
         
-        tk.Label(crystal_frame, text="🔮 Confidence:", 
-                font=('Arial', 8), bg='#1a1a2e', fg='#cccccc').pack(side='left', pady=8)
+        ttk.Label(crystal_frame, text="🔮 Confidence:", style='Djinn.Crystal.TLabel').pack(side='left', pady=8)
         
         self.confidence_var = tk.DoubleVar()
         self.confidence_canvas = tk.Canvas(crystal_frame, width=120, height=15, 
                                           bg='#1a1a2e', highlightthickness=0)
         self.confidence_canvas.pack(side='left', padx=(8, 5), pady=8)
         
-        self.confidence_label = tk.Label(crystal_frame, text="0.00", 
-                                        font=('JetBrains Mono', 8), 
-                                        bg='#1a1a2e', fg='#00ff88')
+        # Crystal items are created once and reshaped on every confidence change
+        self.crystal_bg_id = self.confidence_canvas.create_rectangle(2, 2, 118, 13,
+                                                                     outline='#4a5568', fill='#1a202c')
+        self.crystal_fill_id = self.confidence_canvas.create_rectangle(3, 3, 3, 12, outline='',
+                                                                       fill='#dc2626', state='hidden')
+        self.crystal_sparkle_ids = [
+            self.confidence_canvas.create_oval(0, 0, 0, 0, fill='white', outline='', state='hidden')
+            for _ in range(3)
+        ]
+        
+        self.confidence_text_var = tk.StringVar(value="0.00")
+        self.confidence_label = ttk.Label(crystal_frame, textvariable=self.confidence_text_var,
+                                          style='Djinn.CrystalValue.TLabel')
         self.confidence_label.pack(side='left', pady=8)
         
         # Mystical vote button
@@ -329,9 +518,7 @@ class DjinnResponseWidget(tk.Frame):
         self.response_text.tag_configure('model_info', foreground='#8b5cf6', font=('JetBrains Mono', 8))
         
         # Execution time with mystical styling
-        self.time_label = tk.Label(self, text="", 
-                                  font=('Arial', 8), 
-                                  bg='#1a1a2e', fg='#888888')
+        self.time_label = ttk.Label(self, text="", style='Djinn.Time.TLabel')
         self.time_label.pack(pady=2)
         
         # Initialize confidence crystal
@@ -339,14 +526,10 @@ class DjinnResponseWidget(tk.Frame):
     
     def _draw_confidence_crystal(self, confidence_level: float):
         """🔮 Draw mystical confidence crystal"""
-        self.confidence_canvas.delete("all")
+        canvas = self.confidence_canvas
         width = 120
         height = 15
         
-        # Background crystal structure
-        self.confidence_canvas.create_rectangle(2, 2, width-2, height-2, 
-                                               outline='#4a5568', fill='#1a202c')
-        
         # Confidence fill with gradient effect
         fill_width = int((width - 4) * confidence_level)
         if fill_width > 0:
@@ -357,34 +540,40 @@ class DjinnResponseWidget(tk.Frame):
                 color = '#f59e0b'  # Amber for medium confidence  
             else:
                 color = '#10b981'  # Green for high confidence
-                
-            self.confidence_canvas.create_rectangle(3, 3, 3 + fill_width, height-3,
-                                                   outline='', fill=color)
             
-            # Add sparkle effects for high confidence
-            if confidence_level > 0.8:
-                for i in range(3):
-                    x = random.randint(5, fill_width - 5)
-                    y = random.randint(5, height - 5)
-                    self.confidence_canvas.create_oval(x-1, y-1, x+1, y+1, 
-                                                      fill='white', outline='')
+            canvas.coords(self.crystal_fill_id, 3, 3, 3 + fill_width, height-3)
+            canvas.itemconfigure(self.crystal_fill_id, fill=color, state='normal')
+        else:
+            canvas.itemconfigure(self.crystal_fill_id, state='hidden')
+        
+        # Add sparkle effects for high confidence
+        positions = _SPARKLE_POSITIONS if confidence_level > 0.8 else ()
+        
+        for sparkle_id, position in itertools.zip_longest(self.crystal_sparkle_ids, positions):
+            if position is None:
+                canvas.itemconfigure(sparkle_id, state='hidden')
+            else:
+                x, y = position
+                canvas.coords(sparkle_id, x-1, y-1, x+1, y+1)
+                canvas.itemconfigure(sparkle_id, state='normal')
     
     def set_thinking(self):
         """🎭 Set widget to mystical thinking state with live orchestration"""
         self.start_time = time.time()
         self.current_thinking_index = 0
         self.is_thinking = True
+        self.is_streaming = False
+        self.current_response = None
         self.thinking_animation_active = True
-        self.live_thinking_content = []
+        self.live_thinking_content.clear()
         
         # Start mystical animations
-        self._start_timer()
         self._start_thinking_animation()
         
         # Mystical thinking state
         self.status_label.config(text="🌀 Awakening...", fg='#7c3aed')
         self.confidence_var.set(0)
-        self.confidence_label.config(text="0.00")
+        self.confidence_text_var.set("0.00")
         self._draw_confidence_crystal(0.0)
         self.vote_button.config(state='disabled', bg='#374151')
         
@@ -393,87 +582,102 @@ class DjinnResponseWidget(tk.Frame):
         self.response_text.delete(1.0, tk.END)
         
         thinking_header = f"""🌀 {self.role_info['title']} AWAKENS 🌀
-{'=' * 50}
+{_BANNER_EQ50}
 🔮 Channeling {self.role_info['specialty']}
 ✨ Model: {self.current_model or 'Unknown'}
 🎭 Beginning mystical contemplation...
 
 🧠 LIVE THINKING PROCESS:
-{'-' * 50}
+{_BANNER_DASH50}
 """
         
-        self.response_text.insert(tk.END, thinking_header, 'thinking')
-        self.response_text.insert(tk.END, f"💭 {self.thinking_patterns[0]}\n", 'djinn_name')
-        self.response_text.insert(tk.END, "\n⏳ Unlimited time granted for deep contemplation...\n", 'timestamp')
+        self.response_text.insert(tk.END,
+                                  thinking_header, 'thinking',
+                                  f"💭 {self.thinking_patterns[0]}\n", 'djinn_name',
+                                  "\n⏳ Unlimited time granted for deep contemplation...\n", 'timestamp')
         self.response_text.config(state='disabled')
     
-    def _start_timer(self):
-        """⏰ Start the mystical timer"""
-        self._update_timer_and_status()
-    
     def _start_thinking_animation(self):
-        """🎪 Start mystical thinking animation"""
-        self._animate_thinking_symbols()
+        """🎪 Start the mystical tick that drives both the pulse and the timer"""
+        self._last_timer_second = None
+        self._thinking_stage = None
+        self._timer_color = None
+        self._last_thinking_phase = 0
+        self._thinking_tick()
     
-    def _animate_thinking_symbols(self):
-        """✨ Animate the djinn symbol with pulsing effect"""
+    def _thinking_tick(self):
+        """✨ Single scheduler: pulse every frame, timer and status once per second"""
         if not self.thinking_animation_active:
             return
-            
-        # Pulse the djinn symbol
-        self.pulse_state = (self.pulse_state + 1) % 60
         
-        # Create pulsing effect with sine wave
-        pulse_intensity = (math.sin(self.pulse_state * 0.2) + 1) / 2
+        # Scrolled-out or not yet placed djinn skip the pulse and check back less often
+        mapped = self.winfo_ismapped()
+        if mapped:
+            self._animate_thinking_symbols()
         
-        # Update symbol color based on pulse
-        base_color = self.role_info['color']
-        if pulse_intensity > 0.7:
-            self.symbol_label.config(fg='#ffffff')  # Bright flash
-        elif pulse_intensity > 0.4:
-            self.symbol_label.config(fg=base_color)  # Normal color
-        else:
-            self.symbol_label.config(fg='#666666')  # Dimmed
+        if self.start_time is not None and self.is_thinking:
+            elapsed = time.time() - self.start_time
+            if int(elapsed) != self._last_timer_second:
+                self._last_timer_second = int(elapsed)
+                self._update_timer_and_status(elapsed)
         
-        # Schedule next animation frame
-        self.animation_job = self.after(100, self._animate_thinking_symbols)
+        # Schedule next mystical frame
+        self.animation_job = self.after(100 if mapped else 500, self._thinking_tick)
     
-    def _update_timer_and_status(self):
+    def _animate_thinking_symbols(self):
+        """✨ Animate the djinn symbol with pulsing effect"""
+        # Pulse the djinn symbol
+        self.pulse_state = (self.pulse_state + 1) % 60
+        
+        # Colors are precomputed per frame - only touch the label when it changes
+        color = self.pulse_colors[self.pulse_state]
+        if color != self.symbol_color:
+            self.symbol_color = color
+            self.symbol_label.config(fg=color)
+    
+    def _update_timer_and_status(self, elapsed: float):
         """⏰ Update mystical timer display and thinking orchestration"""
-        if self.start_time is None or not self.is_thinking:
-            return
-            
-        # Calculate elapsed time with mystical precision
-        elapsed = time.time() - self.start_time
-        minutes = int(elapsed // 60)
-        seconds = int(elapsed % 60)
-        time_str = f"{minutes:02d}:{seconds:02d}"
+        time_str = _format_mmss(elapsed)
         
-        # Update timer with color coding
+        # Update timer with color coding (recolor only when the band changes)
+        self.timer_var.set(time_str)
         if elapsed < 30:
-            self.timer_label.config(text=time_str, fg='#10b981')
+            timer_color = '#10b981'
         elif elapsed < 120:
-            self.timer_label.config(text=time_str, fg='#f59e0b')
+            timer_color = '#f59e0b'
         else:
-            self.timer_label.config(text=time_str, fg='#ef4444')
+            timer_color = '#ef4444'
         
-        # Update mystical thinking status every 8 seconds
-        if int(elapsed) % 8 == 0 and int(elapsed) > 0:
+        if timer_color != self._timer_color:
+            self._timer_color = timer_color
+            self.timer_label.config(fg=timer_color)
+        
+        # Update mystical thinking status when a new 8-second phase begins
+        phase = int(elapsed) // 8
+        if phase > 0 and phase != self._last_thinking_phase:
+            self._last_thinking_phase = phase
             self._update_mystical_thinking_status(elapsed)
         
-        # Progressive status updates with mystical themes
-        if elapsed > 45:  # After 45 seconds
-            self.status_label.config(text="🔮 Deep Divination...", fg='#7c3aed')
-        if elapsed > 120:  # After 2 minutes
-            self.status_label.config(text="🌌 Cosmic Reasoning...", fg='#3b82f6')
-        if elapsed > 300:  # After 5 minutes  
-            self.status_label.config(text="💫 Transcendent Analysis...", fg='#10b981')
+        # Progressive status updates with mystical themes (only when the stage changes)
+        if elapsed > 300:  # After 5 minutes
+            stage = ("💫 Transcendent Analysis...", '#10b981')
+        elif elapsed > 120:  # After 2 minutes
+            stage = ("🌌 Cosmic Reasoning...", '#3b82f6')
+        elif elapsed > 45:  # After 45 seconds
+            stage = ("🔮 Deep Divination...", '#7c3aed')
+        else:
+            stage = None
         
-        # Schedule next mystical update
-        self.timer_job = self.after(1000, self._update_timer_and_status)
+        if stage is not None and stage != self._thinking_stage:
+            self._thinking_stage = stage
+            self.status_label.config(text=stage[0], fg=stage[1])
     
     def _update_mystical_thinking_status(self, elapsed_time):
         """🔮 Update mystical thinking orchestration with live insights"""
+        # Streamed model output owns the text area once it starts
+        if self.is_streaming:
+            return
+        
         # Cycle through role-specific thinking patterns
         message_interval = 8
         message_index = (int(elapsed_time) // message_interval) % len(self.thinking_patterns)
@@ -483,71 +687,51 @@ class DjinnResponseWidget(tk.Frame):
             current_pattern = self.thinking_patterns[message_index]
             
             # Add thinking insight to live content
-            timestamp = datetime.now().strftime('%H:%M:%S')
+            timestamp = time.strftime('%H:%M:%S')
             thinking_entry = f"[{timestamp}] {current_pattern}"
             self.live_thinking_content.append(thinking_entry)
             
-            # Update the mystical response display
-            self.response_text.config(state='normal')
+            # Add new thinking line, as (text, tag) pairs for a single insert
+            segments = [f"\n{thinking_entry}", 'thinking']
             
-            # Add new thinking line
-            self.response_text.insert(tk.END, f"\n{thinking_entry}", 'thinking')
+            # Special insights based on thinking time
+            if int(elapsed_time) % 30 == 0 and elapsed_time > 30:
+                mystical_insight = self._generate_mystical_insight(elapsed_time)
+                segments.extend([f"\n🔮 MYSTICAL INSIGHT: {mystical_insight}\n", 'confidence'])
             
             # Add mystical progress indicators
             depth_indicator = "✨" * (message_index + 1)
-            elapsed_display = f"\n⏳ Contemplation depth: {int(elapsed_time)}s {depth_indicator}\n"
+            segments.extend([f"\n⏳ Contemplation depth: {int(elapsed_time)}s {depth_indicator}\n", 'timestamp'])
             
-            # Special insights based on thinking time
-            if int(elapsed_time) % 30 == 0 and elapsed_time > 30:
-                mystical_insight = self._generate_mystical_insight(elapsed_time)
-                self.response_text.insert(tk.END, f"\n🔮 MYSTICAL INSIGHT: {mystical_insight}\n", 'confidence')
+            # Update the mystical response display
+            self.response_text.config(state='normal')
+            self.response_text.insert(tk.END, *segments)
+            
+            # Drop the oldest lines so long contemplations keep the Text widget bounded
+            line_count = int(self.response_text.index('end-1c').split('.')[0])
+            if line_count > self.MAX_THINKING_LINES:
+                self.response_text.delete('1.0', f"{line_count - self.KEEP_THINKING_LINES + 1}.0")
             
-            self.response_text.insert(tk.END, elapsed_display, 'timestamp')
             self.response_text.see(tk.END)
             self.response_text.config(state='disabled')
     
+    def append_token(self, text: str):
+        """🌊 Append streamed model output to the live revelation"""
+        self.response_text.config(state='normal')
+        if not self.is_streaming:
+            self.is_streaming = True
+            self.status_label.config(text="🌊 Revealing...", fg='#58a6ff')
+            self.response_text.insert(tk.END,
+                                      f"\n\n🌊 LIVE REVELATION STREAM:\n{_BANNER_BOX50}\n", 'djinn_name',
+                                      text, ())
+        else:
+            self.response_text.insert(tk.END, text)
+        self.response_text.see(tk.END)
+        self.response_text.config(state='disabled')
+    
     def _generate_mystical_insight(self, elapsed_time):
         """🌟 Generate role-specific mystical insights during long thinking"""
-        insights = {
-            'strategist': [
-                "Multiple timeline convergences detected",
-                "Long-term stability patterns emerging", 
-                "Strategic leverage points crystallizing",
-                "Future-state probability matrices stabilizing"
-            ],
-            'analyst': [
-                "Data correlation patterns strengthening",
-                "Statistical significance thresholds reached",
-                "Critical variable interactions identified",
-                "Analytical framework coherence achieved"
-            ],
-            'arbiter': [
-                "Moral weight calculations balancing",
-                "Justice algorithms reaching equilibrium",
-                "Ethical framework synthesis completing",
-                "Wisdom-based decision tree optimizing"
-            ],
-            'guardian': [
-                "Threat assessment matrices stabilizing",
-                "Security perimeter analysis deepening",
-                "Risk mitigation strategies crystallizing",
-                "Protective protocol optimization active"
-            ],
-            'architect': [
-                "System design blueprints crystallizing",
-                "Architectural pattern recognition active",
-                "Framework integration points solidifying",
-                "Structural optimization algorithms running"
-            ],
-            'historian': [
-                "Historical pattern matching intensifying",
-                "Precedent correlation analysis deepening",
-                "Temporal context synthesis strengthening",
-                "Wisdom archive synchronization active"
-            ]
-        }
-        
-        role_insights = insights.get(self.role, ["Cosmic wisdom channels opening"])
+        role_insights = DJINN_MYSTICAL_INSIGHTS.get(self.role, DEFAULT_MYSTICAL_INSIGHTS)
         phase = int(elapsed_time // 30) % len(role_insights)
         return role_insights[phase]
     
@@ -556,27 +740,41 @@ class DjinnResponseWidget(tk.Frame):
         self.is_thinking = False
         self.thinking_animation_active = False
         
-        if self.timer_job:
-            self.after_cancel(self.timer_job)
-            self.timer_job = None
-            
         if self.animation_job:
             self.after_cancel(self.animation_job)
             self.animation_job = None
             
         # Reset symbol to normal state
-        self.symbol_label.config(fg=self.role_info['color'])
+        self.symbol_color = self.role_info['color']
+        self.symbol_label.config(fg=self.symbol_color)
+    
+    def set_idle(self):
+        """💤 Return the widget to its dormant state without rebuilding it"""
+        self._stop_timer()
+        self.start_time = None
+        self.live_thinking_content.clear()
+        
+        self.status_label.config(text="💤 Dormant", fg='#888888')
+        self.timer_var.set("00:00")
+        self.timer_label.config(fg='#00ff88')
+        self.confidence_var.set(0)
+        self.confidence_text_var.set("0.00")
+        self._draw_confidence_crystal(0.0)
+        self.vote_button.config(state='disabled', bg='#4A90E2')
+        self.time_label.config(text="")
+        
+        self.response_text.config(state='normal')
+        self.response_text.delete(1.0, tk.END)
+        self.response_text.config(state='disabled')
     
     def _is_advanced_thinking_model(self) -> bool:
         """🧠 Check if current model supports advanced thinking patterns"""
-        if not self.current_model:
-            return False
-        model_lower = self.current_model.lower()
-        return any(pattern in model_lower for pattern in ['deepseek', 'o1', 'thinking', 'reasoning'])
+        return self.is_thinking_model
     
     def set_model(self, model_name: str):
         """Set the current model for this djinn"""
         self.current_model = model_name
+        self.is_thinking_model = bool(model_name) and _is_advanced_thinking_model_name(model_name)
     
     def set_response(self, response: DjinnResponse):
         """🎯 Update widget with mystical djinn response revelation"""
@@ -586,22 +784,22 @@ class DjinnResponseWidget(tk.Frame):
         # Calculate final contemplation time
         if self.start_time:
             total_thinking_time = time.time() - self.start_time
-            minutes = int(total_thinking_time // 60)
-            seconds = int(total_thinking_time % 60)
-            final_time_str = f"{minutes:02d}:{seconds:02d}"
-            self.timer_label.config(text=final_time_str, fg='#10b981')
+            final_time_str = _format_mmss(total_thinking_time)
+            self.timer_var.set(final_time_str)
+            self.timer_label.config(fg='#10b981')
         
         # Update mystical status based on response
-        if response.response.startswith("[ERROR"):
+        is_error = response.response.startswith("[ERROR")
+        if is_error:
             self.status_label.config(text="💥 Error", fg='#ef4444')
             self.confidence_var.set(0)
-            self.confidence_label.config(text="0.00")
+            self.confidence_text_var.set("0.00")
             self._draw_confidence_crystal(0.0)
             self.vote_button.config(state='disabled', bg='#374151')
         else:
             self.status_label.config(text="✨ Revealed", fg='#10b981')
             self.confidence_var.set(response.confidence_score)
-            self.confidence_label.config(text=f"{response.confidence_score:.2f}")
+            self.confidence_text_var.set(f"{response.confidence_score:.2f}")
             self._draw_confidence_crystal(response.confidence_score)
             self.vote_button.config(state='normal', bg='#4A90E2')
         
@@ -609,51 +807,58 @@ class DjinnResponseWidget(tk.Frame):
         self.response_text.config(state='normal')
         self.response_text.delete(1.0, tk.END)
         
-        # Add mystical completion header
-        if self.start_time:
-            total_time = time.time() - self.start_time
-            
-            revelation_header = f"""🎆 {self.role_info['title']} REVELATION COMPLETE 🎆
-{'=' * 60}
+        if is_error:
+            # Errors skip the revelation header, thinking preview and live summary
+            segments = [f"💥 ERROR\n{response.response}\n", 'thinking']
+        else:
+            # Add mystical completion header
+            if self.start_time:
+                total_time = time.time() - self.start_time
+                
+                header_parts = [f"""🎆 {self.role_info['title']} REVELATION COMPLETE 🎆
+{_BANNER_EQ60}
 🕰️ Total Contemplation: {total_time:.1f}s
 🎯 Model Execution: {response.execution_time:.1f}s  
 💫 Confidence Crystal: {response.confidence_score:.2f}
 🌌 Mystical Resonance: {'High' if response.confidence_score > 0.7 else 'Medium' if response.confidence_score > 0.4 else 'Low'}
 
-"""
+"""]
 
-            # Check for advanced thinking content
-            if response.metadata and response.metadata.get("has_thinking", False):
-                thinking_content = response.metadata.get("thinking_content", "")
-                model_name = response.metadata.get("model_name", "")
+                # Check for advanced thinking content
+                if response.metadata and response.metadata.get("has_thinking", False):
+                    thinking_content = response.metadata.get("thinking_content", "")
+                    model_name = response.metadata.get("model_name", "")
+                    
+                    # Show first 800 characters of thinking
+                    thinking_preview = thinking_content[:800] + ("...\n[Thinking stream truncated]" if len(thinking_content) > 800 else "")
+                    header_parts.extend([
+                        f"🤖 Advanced Model: {model_name}\n",
+                        "🧠 RAW THINKING STREAM:\n",
+                        _BANNER_BOX50 + "\n",
+                        thinking_preview,
+                        "\n" + _BANNER_BOX50 + "\n\n",
+                    ])
                 
-                revelation_header += f"🤖 Advanced Model: {model_name}\n"
-                revelation_header += f"🧠 RAW THINKING STREAM:\n"
-                revelation_header += "─" * 50 + "\n"
-                # Show first 800 characters of thinking
-                thinking_preview = thinking_content[:800] + ("...\n[Thinking stream truncated]" if len(thinking_content) > 800 else "")
-                revelation_header += thinking_preview
-                revelation_header += "\n" + "─" * 50 + "\n\n"
-            
-            # Show live thinking summary if we captured it
-            if self.live_thinking_content:
-                revelation_header += f"🔮 LIVE CONTEMPLATION SUMMARY:\n"
-                revelation_header += "─" * 50 + "\n"
-                for entry in self.live_thinking_content[-5:]:  # Show last 5 entries
-                    revelation_header += f"{entry}\n"
-                revelation_header += "─" * 50 + "\n\n"
-            
-            revelation_header += f"🌟 FINAL WISDOM FROM {self.djinn_name.upper()}:\n"
-            revelation_header += "=" * 60 + "\n\n"
+                # Show live thinking summary if we captured it
+                if self.live_thinking_content:
+                    header_parts.append("🔮 LIVE CONTEMPLATION SUMMARY:\n")
+                    header_parts.append(_BANNER_BOX50 + "\n")
+                    for entry in self.live_thinking_content:  # Deque keeps only the last entries
+                        header_parts.append(f"{entry}\n")
+                    header_parts.append(_BANNER_BOX50 + "\n\n")
+                
+                header_parts.append(f"🌟 FINAL WISDOM FROM {self.djinn_name.upper()}:\n")
+                header_parts.append(_BANNER_EQ60 + "\n\n")
+                revelation_header = "".join(header_parts)
+                
+                segments = [revelation_header, 'thinking']
+            else:
+                segments = []
             
-            self.response_text.insert(tk.END, revelation_header, 'thinking')
-        
-        # Add the actual mystical response with formatting
-        self.response_text.insert(tk.END, response.response)
-        
-        # Add mystical signature
-        signature = f"\n\n" + "─" * 60 + f"\n🌟 Channeled by {self.djinn_name} • {self.role_info['title']} 🌟"
-        self.response_text.insert(tk.END, signature, 'djinn_name')
+            # Add the actual mystical response and signature in the same insert
+            signature = f"\n\n{_BANNER_BOX60}\n🌟 Channeled by {self.djinn_name} • {self.role_info['title']} 🌟"
+            segments.extend([response.response, (), signature, 'djinn_name'])
+        self.response_text.insert(tk.END, *segments)
         
         self.response_text.config(state='disabled')
         
@@ -670,13 +875,23 @@ class DjinnResponseWidget(tk.Frame):
     
     def vote_for_response(self):
         """Handle vote button click"""
-        # This would trigger a callback to the main GUI
-        if hasattr(self, 'vote_callback'):
+        # Nothing to vote for until a response has arrived
+        if self.vote_callback is not None and self.current_response is not None:
             self.vote_callback(self.current_response)
 
 class DjinnCouncilGUI:
     """🌌 MYSTICAL DJINN COUNCIL NEXUS - Supreme Orchestration Interface 🌌"""
     
+    # Previous conversation turns written to the chat display per idle slice
+    HISTORY_TURNS_PER_SLICE = 2
+    
+    # Character budget for restored history; the newest turn is always shown
+    HISTORY_CHAR_BUDGET = 32 * 1024
+    
+    # Chat display is trimmed back to KEEP lines once it exceeds MAX lines
+    MAX_CHAT_LINES = 2500
+    KEEP_CHAT_LINES = 2000
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("🌂 DJINN COUNCIL NEXUS - Mystical Multi-Agent Orchestration 🌂")
@@ -685,6 +900,27 @@ class DjinnCouncilGUI:
         # Apply dark mystical theme
         self.root.configure(bg='#0a0a0f')
         
+        # Shared named fonts - widgets reference one font handle each
+        self.fonts = {
+            'title': tkfont.Font(family='Arial', size=18, weight='bold'),
+            'subtitle': tkfont.Font(family='Arial', size=10),
+            'mono': tkfont.Font(family='JetBrains Mono', size=10),
+            'mono_bold': tkfont.Font(family='JetBrains Mono', size=10, weight='bold'),
+            'mono_italic': tkfont.Font(family='JetBrains Mono', size=10, slant='italic'),
+            'mono_small': tkfont.Font(family='JetBrains Mono', size=9),
+            'mono_small_bold': tkfont.Font(family='JetBrains Mono', size=9, weight='bold'),
+            'mono_big': tkfont.Font(family='JetBrains Mono', size=11),
+            'mono_tiny': tkfont.Font(family='JetBrains Mono', size=8),
+            'heading': tkfont.Font(family='Arial', size=12, weight='bold'),
+            'section': tkfont.Font(family='Arial', size=11, weight='bold'),
+            'hdr_bold': tkfont.Font(family='Arial', size=10, weight='bold'),
+            'label': tkfont.Font(family='Arial', size=9),
+            'label_bold': tkfont.Font(family='Arial', size=9, weight='bold'),
+            'small': tkfont.Font(family='Arial', size=8),
+            'small_italic': tkfont.Font(family='Arial', size=8, slant='italic'),
+            'symbol': tkfont.Font(family='Arial', size=14),
+        }
+        
         # Configure mystical styling
         style = ttk.Style()
         style.theme_use('clam')
@@ -694,21 +930,57 @@ class DjinnCouncilGUI:
         style.configure('Mystical.TLabel', background='#1a1a2e', foreground='#e6e6fa')
         style.configure('Mystical.TLabelFrame', background='#1a1a2e', foreground='#4A90E2')
         
+        # Shared djinn widget label styles
+        _ensure_djinn_styles(self.root)
+        
+        # Role cards in the configuration realm
+        style.configure('Role.Inner.TFrame', background='#0f0f23')
+        style.configure('Role.Title.TLabel', background='#0f0f23', foreground='#e6e6fa', font=self.fonts['hdr_bold'])
+        style.configure('Role.Desc.TLabel', background='#0f0f23', foreground='#b0b0b0', font=self.fonts['small'])
+        style.configure('Role.Model.TLabel', background='#0f0f23', foreground='#cccccc', font=self.fonts['label'])
+        
+        style.configure('Mystical.Horizontal.TProgressbar', background='#4A90E2',
+                        troughcolor='#1a1a2e', bordercolor='#1a1a2e',
+                        lightcolor='#7c3aed', darkcolor='#7c3aed')
+        
+        # Hand-drawn orb animation instead of the native progress bar
+        self.mystical_eyecandy = False
+        
         # Initialize mystical components
         self.model_manager = OllamaModelManager()
         self.council = None
         self.djinn_widgets = {}
-        self.response_queue = queue.Queue()
+        self.response_queue = ResponseQueue()
+        self.max_messages_per_tick = 256  # Streamed tokens arrive many per second
+        self._wake_pending = False
+        self._wake_lock = threading.Lock()  # Workers and the GUI thread both check-and-set _wake_pending
+        
+        # Persistent daemon workers - council invocations and model refreshes run one of each at a time
+        self.council_worker = BackgroundWorker('council')
+        self.models_worker = BackgroundWorker('ollama-models')
+        self.council_future = None
+        self.models_refresh_pending = False
+        self.closed = False  # Set once the main loop has exited
+        self._tk_batch_depth = 0
+        
+        # Worker threads may only wake the GUI directly when Tcl is thread-enabled
+        self.tk_threaded = bool(self.root.tk.call('info', 'exists', 'tcl_platform(threaded)'))
         
         # Typewriter layout tracking
         self.djinn_positions = {}
         self.max_columns = 3  # 3 djinn per row in typewriter layout
+        self.djinn_row_minsize = 420  # Reserved row height so unplaced rows still scroll
+        self.unplaced_djinn = set()  # Widgets created but not yet gridded into view
         
         # User identification
         self.user_id = "gui_user"
         
         # Mystical configuration
         self.config_file = "djinn_gui_config.json"
+        self._config_cache = None
+        self._config_mtime = None
+        self._config_hash = None
+        self._memory_stats_cache = None  # (memory, version, text)
         self.current_config = self.load_config()
         
         # Setup mystical GUI
@@ -716,10 +988,23 @@ class DjinnCouncilGUI:
         self.setup_council()
         
         # Start mystical response monitoring
+        if self.tk_threaded:
+            self.root.bind('<<CouncilUpdate>>', lambda event: self.monitor_responses())
+            self._fallback_drain()
         self.monitor_responses()
     
     def setup_mystical_gui(self):
         """🎨 Setup the mystical GUI layout with ethereal aesthetics"""
+        # Build hidden so Tk lays the window out once instead of reflowing per widget
+        self.root.withdraw()
+        try:
+            self._build_mystical_layout()
+        finally:
+            self.root.update_idletasks()
+            self.root.deiconify()
+    
+    def _build_mystical_layout(self):
+        """Create the header, paned realms and status bar"""
         # Create mystical main container
         main_container = tk.Frame(self.root, bg='#0a0a0f')
         main_container.pack(fill='both', expand=True, padx=8, pady=8)
@@ -752,21 +1037,21 @@ class DjinnCouncilGUI:
         # Cosmic title with mystical symbols
         title_label = tk.Label(header_frame, 
                               text="🌌 🌂 DJINN COUNCIL NEXUS 🌂 🌌",
-                              font=('Arial', 18, 'bold'),
+                              font=self.fonts['title'],
                               bg='#0a0a0f', fg='#4A90E2')
         title_label.pack(pady=15)
         
         # Mystical subtitle
         subtitle_label = tk.Label(header_frame,
                                  text="Mystical Multi-Agent Orchestration • Command Legions of AI Djinn • Channel Cosmic Wisdom",
-                                 font=('Arial', 10),
+                                 font=self.fonts['subtitle'],
                                  bg='#0a0a0f', fg='#b0b0b0')
         subtitle_label.pack()
     
     def setup_mystical_config_frame(self, parent):
         """🔮 Setup mystical configuration realm with role descriptions"""
         config_frame = tk.LabelFrame(parent, text="🔮 Mystical Council Configuration 🔮", 
-                                    font=('Arial', 12, 'bold'),
+                                    font=self.fonts['heading'],
                                     bg='#1a1a2e', fg='#4A90E2', 
                                     relief='groove', bd=2)
         parent.add(config_frame, weight=0)
@@ -777,11 +1062,13 @@ class DjinnCouncilGUI:
         
         # Section header
         header_label = tk.Label(models_frame, text="✨ Djinn Binding & Model Assignment ✨", 
-                               font=('Arial', 11, 'bold'), bg='#1a1a2e', fg='#e6e6fa')
+                               font=self.fonts['section'], bg='#1a1a2e', fg='#e6e6fa')
         header_label.pack(anchor='w', pady=(0, 8))
         
         # Create mystical model selection with role descriptions
         self.model_vars = {}
+        self.model_combos = {}
+        self.model_assignments = {}  # Python-side mirror of model_vars, kept by traces
         roles_container = tk.Frame(models_frame, bg='#1a1a2e')
         roles_container.pack(fill='both', expand=True)
         
@@ -792,6 +1079,7 @@ class DjinnCouncilGUI:
             col = i % 2
             
             # Create mystical role frame
+            # tk.Frame keeps the classic raised border; clam draws ttk frame reliefs differently
             role_container = tk.Frame(roles_container, bg='#0f0f23', relief='raised', bd=1)
             role_container.grid(row=row, column=col, padx=8, pady=5, sticky='ew')
             
@@ -802,40 +1090,38 @@ class DjinnCouncilGUI:
             role_info = DJINN_ROLE_DESCRIPTIONS[role]
             
             # Header with symbol and title
-            header_frame = tk.Frame(role_container, bg='#0f0f23')
+            header_frame = ttk.Frame(role_container, style='Role.Inner.TFrame')
             header_frame.pack(fill='x', padx=8, pady=(5, 2))
             
             symbol_label = tk.Label(header_frame, text=role_info['symbol'], 
-                                   font=('Arial', 14), bg='#0f0f23', fg=role_info['color'])
+                                   font=self.fonts['symbol'], bg='#0f0f23', fg=role_info['color'])
             symbol_label.pack(side='left')
             
-            title_label = tk.Label(header_frame, text=role_info['title'], 
-                                  font=('Arial', 10, 'bold'), bg='#0f0f23', fg='#e6e6fa')
+            title_label = ttk.Label(header_frame, text=role_info['title'], style='Role.Title.TLabel')
             title_label.pack(side='left', padx=(5, 0))
             
             # Full Description (no truncation)
-            desc_label = tk.Label(role_container, text=role_info['description'], 
-                                 font=('Arial', 8), bg='#0f0f23', fg='#b0b0b0',
-                                 wraplength=350, justify='left')
+            desc_label = ttk.Label(role_container, text=role_info['description'], style='Role.Desc.TLabel',
+                                  wraplength=350, justify='left')
             desc_label.pack(fill='x', padx=8, pady=(0, 3))
             
             # Specialty
             specialty_label = tk.Label(role_container, text=f"✨ {role_info['specialty']}", 
-                                      font=('Arial', 8, 'italic'), bg='#0f0f23', fg=role_info['color'])
+                                      font=self.fonts['small_italic'], bg='#0f0f23', fg=role_info['color'])
             specialty_label.pack(fill='x', padx=8, pady=(0, 5))
             
             # Model selection
-            model_frame = tk.Frame(role_container, bg='#0f0f23')
+            model_frame = ttk.Frame(role_container, style='Role.Inner.TFrame')
             model_frame.pack(fill='x', padx=8, pady=(0, 8))
             
-            tk.Label(model_frame, text="Model:", font=('Arial', 9), 
-                    bg='#0f0f23', fg='#cccccc').pack(side='left')
+            ttk.Label(model_frame, text="Model:", style='Role.Model.TLabel').pack(side='left')
             
             self.model_vars[role] = tk.StringVar()
             model_combo = ttk.Combobox(model_frame, textvariable=self.model_vars[role],
                                       values=self.model_manager.available_models,
                                       width=25, state='readonly')
             model_combo.pack(side='right', padx=(5, 0))
+            self.model_combos[role] = model_combo
             
             # No more annoying tooltips - info is already displayed above!
             
@@ -844,6 +1130,9 @@ class DjinnCouncilGUI:
                 self.model_vars[role].set(self.current_config['model_assignments'][role])
             else:
                 self.model_vars[role].set(self.model_manager.available_models[0] if self.model_manager.available_models else 'llama3.2:latest')
+            
+            self.model_assignments[role] = self.model_vars[role].get()
+            self.model_vars[role].trace_add('write', functools.partial(self._mirror_model_var, role))
         
         # Mystical controls section
         controls_frame = tk.Frame(config_frame, bg='#1a1a2e')
@@ -858,11 +1147,11 @@ class DjinnCouncilGUI:
         consensus_header.pack(fill='x', pady=(0, 5))
         
         tk.Label(consensus_header, text="🌌 Consensus Mode:", 
-                font=('Arial', 10, 'bold'), bg='#1a1a2e', fg='#e6e6fa').pack(side='left')
+                font=self.fonts['hdr_bold'], bg='#1a1a2e', fg='#e6e6fa').pack(side='left')
         
         self.consensus_var = tk.StringVar(value='weighted_roles')
         consensus_combo = ttk.Combobox(consensus_header, textvariable=self.consensus_var,
-                                      values=[mode.value for mode in ConsensusMode],
+                                      values=_CONSENSUS_MODE_VALUES,
                                       width=18, state='readonly')
         consensus_combo.pack(side='left', padx=(8, 0))
         
@@ -870,22 +1159,24 @@ class DjinnCouncilGUI:
         self.consensus_info_frame = tk.Frame(consensus_section, bg='#0f0f23', relief='sunken', bd=1)
         self.consensus_info_frame.pack(fill='x', pady=(0, 5))
         
-        self.consensus_title_label = tk.Label(self.consensus_info_frame, text="", 
-                                             font=('Arial', 9, 'bold'), bg='#0f0f23', fg='#fbbf24')
+        self.consensus_title_var = tk.StringVar()
+        self.consensus_desc_var = tk.StringVar()
+        
+        self.consensus_title_label = tk.Label(self.consensus_info_frame, textvariable=self.consensus_title_var, 
+                                             font=self.fonts['label_bold'], bg='#0f0f23', fg='#fbbf24')
         self.consensus_title_label.pack(anchor='w', padx=5, pady=(3, 0))
         
-        self.consensus_desc_label = tk.Label(self.consensus_info_frame, text="", 
-                                            font=('Arial', 8), bg='#0f0f23', fg='#b0b0b0',
+        self.consensus_desc_label = tk.Label(self.consensus_info_frame, textvariable=self.consensus_desc_var, 
+                                            font=self.fonts['small'], bg='#0f0f23', fg='#b0b0b0',
                                             wraplength=400, justify='left')
         self.consensus_desc_label.pack(anchor='w', padx=5, pady=(0, 3))
         
         # Update consensus info when selection changes
         def update_consensus_info(*args):
-            current_mode = self.consensus_var.get()
-            if current_mode in CONSENSUS_MODE_DESCRIPTIONS:
-                mode_info = CONSENSUS_MODE_DESCRIPTIONS[current_mode]
-                self.consensus_title_label.config(text=mode_info['title'])
-                self.consensus_desc_label.config(text=f"{mode_info['description']} {mode_info['details']}")
+            display = _CONSENSUS_DISPLAY.get(self.consensus_var.get())
+            if display:
+                self.consensus_title_var.set(display[0])
+                self.consensus_desc_var.set(display[1])
         
         self.consensus_var.trace('w', update_consensus_info)
         update_consensus_info()  # Initialize with default
@@ -905,14 +1196,14 @@ class DjinnCouncilGUI:
         
         for text, command, color in mystical_buttons:
             btn = tk.Button(buttons_frame, text=text, command=command,
-                           font=('Arial', 9, 'bold'), bg=color, fg='white',
+                           font=self.fonts['label_bold'], bg=color, fg='white',
                            relief='raised', bd=2, padx=8, pady=2)
             btn.pack(side='right', padx=2)
     
     def setup_mystical_chat_frame(self, parent):
         """💫 Setup mystical consultation interface"""
         chat_frame = tk.LabelFrame(parent, text="💫 Mystical Council Consultation 💫", 
-                                  font=('Arial', 12, 'bold'),
+                                  font=self.fonts['heading'],
                                   bg='#1a1a2e', fg='#4A90E2',
                                   relief='groove', bd=2)
         parent.add(chat_frame, weight=1)
@@ -923,19 +1214,21 @@ class DjinnCouncilGUI:
         
         self.chat_history = scrolledtext.ScrolledText(
             history_frame, height=12, wrap='word',
-            font=('JetBrains Mono', 10),
+            font=self.fonts['mono'],
             bg='#0d1117', fg='#e6edf3',
             insertbackground='#00ff88',
             selectbackground='#264f78',
             relief='sunken', bd=2
         )
         self.chat_history.pack(fill='both', expand=True)
+        self.history_load_job = None
+        self.chat_see_job = None
         
         # Configure mystical text tags
-        self.chat_history.tag_configure('user_query', foreground='#58a6ff', font=('JetBrains Mono', 10, 'bold'))
-        self.chat_history.tag_configure('council_response', foreground='#7ee787', font=('JetBrains Mono', 10))
-        self.chat_history.tag_configure('timestamp', foreground='#6e7681', font=('JetBrains Mono', 9))
-        self.chat_history.tag_configure('mystical', foreground='#bc8cff', font=('JetBrains Mono', 10, 'italic'))
+        self.chat_history.tag_configure('user_query', foreground='#58a6ff', font=self.fonts['mono_bold'])
+        self.chat_history.tag_configure('council_response', foreground='#7ee787', font=self.fonts['mono'])
+        self.chat_history.tag_configure('timestamp', foreground='#6e7681', font=self.fonts['mono_small'])
+        self.chat_history.tag_configure('mystical', foreground='#bc8cff', font=self.fonts['mono_italic'])
         
         # Mystical input realm
         input_frame = tk.Frame(chat_frame, bg='#1a1a2e')
@@ -943,14 +1236,14 @@ class DjinnCouncilGUI:
         
         # Query input with mystical styling
         tk.Label(input_frame, text="🔮 Pose Your Question to the Council:", 
-                font=('Arial', 11, 'bold'), bg='#1a1a2e', fg='#e6e6fa').pack(anchor='w', pady=(0, 5))
+                font=self.fonts['section'], bg='#1a1a2e', fg='#e6e6fa').pack(anchor='w', pady=(0, 5))
         
         query_input_frame = tk.Frame(input_frame, bg='#1a1a2e')
         query_input_frame.pack(fill='x', pady=5)
         
         self.query_text = scrolledtext.ScrolledText(
             query_input_frame, height=4, wrap='word',
-            font=('JetBrains Mono', 11),
+            font=self.fonts['mono_big'],
             bg='#0d1117', fg='#e6edf3',
             insertbackground='#00ff88',
             selectbackground='#264f78',
@@ -965,7 +1258,7 @@ class DjinnCouncilGUI:
         self.submit_button = tk.Button(button_frame, 
                                       text="🌌\n🌂\nINVOKE\nCOUNCIL\n🌂\n🌌", 
                                       command=self.invoke_council,
-                                      font=('Arial', 11, 'bold'),
+                                      font=self.fonts['section'],
                                       bg='#4A90E2', fg='white',
                                       relief='raised', bd=3,
                                       padx=8, pady=8)
@@ -977,19 +1270,26 @@ class DjinnCouncilGUI:
         progress_frame.pack(fill='x', pady=8)
         
         self.progress_label = tk.Label(progress_frame, textvariable=self.progress_var,
-                                      font=('Arial', 10), bg='#1a1a2e', fg='#b0b0b0')
+                                      font=self.fonts['subtitle'], bg='#1a1a2e', fg='#b0b0b0')
         self.progress_label.pack(side='left')
         
-        # Mystical progress bar
-        self.progress_canvas = tk.Canvas(progress_frame, height=20, bg='#1a1a2e', highlightthickness=0)
-        self.progress_canvas.pack(side='right', fill='x', expand=True, padx=(10, 0))
+        # Mystical progress bar (native indeterminate bar animates inside Tk)
+        if self.mystical_eyecandy:
+            self.progress_canvas = tk.Canvas(progress_frame, height=20, bg='#1a1a2e', highlightthickness=0)
+            self.progress_canvas.pack(side='right', fill='x', expand=True, padx=(10, 0))
+        else:
+            self.progress_bar = ttk.Progressbar(progress_frame, mode='indeterminate',
+                                                style='Mystical.Horizontal.TProgressbar')
+            self.progress_bar.pack(side='right', fill='x', expand=True, padx=(10, 0))
         
         self.progress_active = False
+        self.progress_animation_job = None
+        self.progress_orb_ids = []
     
     def setup_mystical_responses_frame(self, parent):
         """🎭 Setup mystical djinn responses with typewriter layout"""
         responses_frame = tk.LabelFrame(parent, text="🎭 Djinn Orchestration Chamber 🎭", 
-                                       font=('Arial', 12, 'bold'),
+                                       font=self.fonts['heading'],
                                        bg='#1a1a2e', fg='#4A90E2',
                                        relief='groove', bd=2)
         parent.add(responses_frame, weight=3)
@@ -1009,6 +1309,7 @@ class DjinnCouncilGUI:
         # Typewriter layout container
         canvas = tk.Canvas(individual_frame, bg='#0f0f23', highlightthickness=0)
         scrollbar = ttk.Scrollbar(individual_frame, orient="vertical", command=canvas.yview)
+        self.djinn_canvas = canvas
         
         # This will hold our typewriter grid
         self.djinn_responses_frame = tk.Frame(canvas, bg='#0f0f23')
@@ -1019,7 +1320,13 @@ class DjinnCouncilGUI:
         )
         
         canvas.create_window((0, 0), window=self.djinn_responses_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        # Every view change (scroll or resize) may bring unplaced djinn rows into view
+        def on_djinn_view_changed(*args):
+            scrollbar.set(*args)
+            self._place_visible_djinn_widgets()
+        
+        canvas.configure(yscrollcommand=on_djinn_view_changed)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -1034,25 +1341,51 @@ class DjinnCouncilGUI:
         
         self.consensus_text = scrolledtext.ScrolledText(
             consensus_frame, wrap='word',
-            font=('JetBrains Mono', 11),
+            font=self.fonts['mono_big'],
             bg='#0d1117', fg='#e6edf3',
             insertbackground='#00ff88',
             selectbackground='#264f78',
-            relief='sunken', bd=2
+            relief='sunken', bd=2,
+            state='disabled'  # Read-only, so the skip-unchanged check below stays valid
         )
         self.consensus_text.pack(fill='both', expand=True, padx=8, pady=8)
+        self._last_consensus_hash = None
         
-        # Mystical metrics realm
-        metrics_frame = tk.Frame(self.responses_notebook, bg='#0f0f23')
-        self.responses_notebook.add(metrics_frame, text="📊 Mystical Metrics")
+        # Mystical metrics realm (text pane is materialized when the tab is first opened)
+        self.metrics_frame = tk.Frame(self.responses_notebook, bg='#0f0f23')
+        self.responses_notebook.add(self.metrics_frame, text="📊 Mystical Metrics")
+        self.metrics_text = None
+        self._last_metrics_hash = None
+        self._last_session = None
+        self._metrics_session = None  # Session the metrics pane currently shows
         
+        self.responses_notebook.bind("<<NotebookTabChanged>>", self._on_responses_tab_changed)
+    
+    def _metrics_tab_visible(self) -> bool:
+        """Whether the metrics tab is the selected responses tab"""
+        return self.responses_notebook.select() == str(self.metrics_frame)
+    
+    def _on_responses_tab_changed(self, event=None):
+        """📊 Materialize the metrics pane when first opened and render any session it has not shown"""
+        if not self._metrics_tab_visible():
+            return
+        
+        if self.metrics_text is None:
+            self._create_metrics_text()
+        
+        if self._last_session is not None and self._last_session is not self._metrics_session:
+            self.update_metrics_display(self._last_session)
+    
+    def _create_metrics_text(self):
+        """Build the metrics text pane"""
         self.metrics_text = scrolledtext.ScrolledText(
-            metrics_frame, wrap='word',
-            font=('JetBrains Mono', 10),
+            self.metrics_frame, wrap='word',
+            font=self.fonts['mono'],
             bg='#0d1117', fg='#e6edf3',
             insertbackground='#00ff88',
             selectbackground='#264f78',
-            relief='sunken', bd=2
+            relief='sunken', bd=2,
+            state='disabled'
         )
         self.metrics_text.pack(fill='both', expand=True, padx=8, pady=8)
     
@@ -1065,7 +1398,7 @@ class DjinnCouncilGUI:
         # Mystical status with cosmic indicators
         self.status_var = tk.StringVar(value="✨ Mystical Council Nexus Initialized - Djinn Await Commands ✨")
         self.status_label = tk.Label(self.status_bar, textvariable=self.status_var,
-                                    font=('Arial', 10), bg='#0a0a0f', fg='#e6e6fa')
+                                    font=self.fonts['subtitle'], bg='#0a0a0f', fg='#e6e6fa')
         self.status_label.pack(side='left', padx=10, pady=8)
         
         # Council state indicator with mystical styling
@@ -1073,11 +1406,11 @@ class DjinnCouncilGUI:
         state_frame.pack(side='right', padx=10, pady=8)
         
         tk.Label(state_frame, text="Nexus State:", 
-                font=('Arial', 9), bg='#0a0a0f', fg='#b0b0b0').pack(side='left')
+                font=self.fonts['label'], bg='#0a0a0f', fg='#b0b0b0').pack(side='left')
         
         self.state_var = tk.StringVar(value="IDLE")
         self.state_label = tk.Label(state_frame, textvariable=self.state_var, 
-                                   font=('JetBrains Mono', 9, 'bold'), 
+                                   font=self.fonts['mono_small_bold'], 
                                    bg='#0a0a0f', fg='#10b981')
         self.state_label.pack(side='left', padx=(5, 0))
     
@@ -1093,8 +1426,9 @@ class DjinnCouncilGUI:
             # Apply current configuration
             self.apply_config()
             
-            # Load any existing conversation history into chat display
-            self.load_conversation_history()
+            # Fill the chat display with previous history once the window has painted
+            self._cancel_history_load()
+            self.history_load_job = self.root.after_idle(self.load_conversation_history)
             
             self.status_var.set("✨ Mystical Council initialized successfully ✨")
             
@@ -1106,49 +1440,134 @@ class DjinnCouncilGUI:
             self.status_var.set(f"Error: {str(e)}")
     
     def create_djinn_widgets(self):
-        """🎭 Create mystical djinn widgets in typewriter layout"""
-        # Clear existing widgets
-        for widget in self.djinn_widgets.values():
-            widget.destroy()
-        self.djinn_widgets.clear()
+        """🎭 Reconcile djinn widgets with the council in typewriter layout (new ones are summoned on first use)"""
+        council_roles = self.council.djinn_roles if self.council else {}
+        
+        # Retire widgets whose djinn left the council or changed identity
+        for role_key, widget in list(self.djinn_widgets.items()):
+            djinn_role = council_roles.get(role_key)
+            if djinn_role is None or (widget.djinn_name, widget.role) != (djinn_role.name, djinn_role.role):
+                widget._stop_timer()
+                widget.destroy()
+                del self.djinn_widgets[role_key]
+                self.unplaced_djinn.discard(role_key)
+        
+        # Reserve slots in TYPEWRITER LAYOUT (left-to-right, then wrap)
         self.djinn_positions.clear()
+        for i, role_key in enumerate(council_roles):
+            position = (i // self.max_columns, i % self.max_columns)
+            self.djinn_positions[role_key] = position
+            self.djinn_responses_frame.grid_rowconfigure(position[0], weight=1,
+                                                         minsize=self.djinn_row_minsize)
+            
+            # Surviving widgets are updated in place
+            widget = self.djinn_widgets.get(role_key)
+            if widget is not None:
+                if widget.position != position:
+                    widget.position = position
+                    if role_key not in self.unplaced_djinn:
+                        widget.grid(row=position[0], column=position[1])
+                if role_key in self.model_vars:
+                    widget.set_model(self.model_vars[role_key].get())
+                widget.set_idle()
+    
+    def _get_or_create_djinn_widget(self, role_key: str) -> Optional[DjinnResponseWidget]:
+        """🎭 Return the widget for a djinn, creating it in its typewriter slot on first use"""
+        widget = self.djinn_widgets.get(role_key)
+        if widget is not None:
+            return widget
         
-        # Create new widgets in TYPEWRITER LAYOUT (left-to-right, then wrap)
-        if self.council and self.council.djinn_roles:
-            for i, (role_key, djinn_role) in enumerate(self.council.djinn_roles.items()):
-                # Calculate typewriter position
-                row = i // self.max_columns
-                col = i % self.max_columns
-                position = (row, col)
-                
-                # Create mystical djinn widget
-                widget = DjinnResponseWidget(self.djinn_responses_frame, 
-                                           djinn_role.name, djinn_role.role, position)
-                
-                # Place in typewriter grid
+        if not self.council or role_key not in self.council.djinn_roles:
+            return None
+        
+        djinn_role = self.council.djinn_roles[role_key]
+        if role_key not in self.djinn_positions:
+            slot = len(self.djinn_positions)
+            self.djinn_positions[role_key] = (slot // self.max_columns, slot % self.max_columns)
+        position = self.djinn_positions[role_key]
+        
+        # Create mystical djinn widget
+        widget = DjinnResponseWidget(self.djinn_responses_frame, 
+                                   djinn_role.name, djinn_role.role, position)
+        
+        widget.vote_callback = self.vote_for_djinn_response
+        self.djinn_widgets[role_key] = widget
+        
+        # Set model info for widget
+        if role_key in self.model_vars:
+            widget.set_model(self.model_vars[role_key].get())
+        
+        # Place in typewriter grid once its row scrolls into view
+        self.unplaced_djinn.add(role_key)
+        self._place_visible_djinn_widgets()
+        
+        return widget
+    
+    def _place_visible_djinn_widgets(self):
+        """🎭 Grid djinn widgets whose typewriter row is near the viewport and un-grid those far outside it"""
+        frame_height = self.djinn_responses_frame.winfo_height()
+        
+        # Before the first layout pass the viewport is unknown - place everything
+        if frame_height <= 1:
+            for role_key in list(self.unplaced_djinn):
+                row, col = self.djinn_widgets[role_key].position
+                self.djinn_widgets[role_key].grid(row=row, column=col, padx=8, pady=8, sticky='nsew')
+            self.unplaced_djinn.clear()
+            return
+        
+        # Keep one reserved row of margin mapped on each side so scrolling never shows empty slots
+        top, bottom = self.djinn_canvas.yview()
+        view_top = top * frame_height - self.djinn_row_minsize
+        view_bottom = bottom * frame_height + self.djinn_row_minsize
+        
+        for role_key, widget in self.djinn_widgets.items():
+            row, col = widget.position
+            _, row_y, _, row_height = self.djinn_responses_frame.grid_bbox(col, row)
+            near_view = row_y < view_bottom and row_y + row_height > view_top
+            
+            if near_view and role_key in self.unplaced_djinn:
                 widget.grid(row=row, column=col, padx=8, pady=8, sticky='nsew')
-                
-                # Configure grid weights for this row
-                self.djinn_responses_frame.grid_rowconfigure(row, weight=1)
-                
-                widget.vote_callback = self.vote_for_djinn_response
-                self.djinn_widgets[role_key] = widget
-                self.djinn_positions[role_key] = position
-                
-                # Set model info for widget
-                if role_key in self.model_vars:
-                    current_model = self.model_vars[role_key].get()
-                    widget.set_model(current_model)
+                self.unplaced_djinn.discard(role_key)
+            elif not near_view and role_key not in self.unplaced_djinn:
+                # grid_remove keeps the grid options; the reserved row minsize keeps the scroll height
+                widget.grid_remove()
+                self.unplaced_djinn.add(role_key)
+    
+    def _mirror_model_var(self, role: str, *trace_args):
+        """Copy a role's model selection into model_assignments when its variable is written"""
+        self.model_assignments[role] = self.model_vars[role].get()
     
     def refresh_models(self):
-        """Refresh available Ollama models"""
-        self.model_manager.refresh_models()
+        """Refresh available Ollama models in the background"""
+        if self.models_refresh_pending:
+            return
         
-        # Update all comboboxes
-        for role in self.model_vars:
-            # Find the combobox widget and update its values
-            # This is a simplified approach - in practice you'd need to traverse the widget tree
-            pass
+        self.models_refresh_pending = True
+        self.status_var.set("🔄 Searching for Ollama models...")
+        future = self.models_worker.submit(self.model_manager.fetch_models)
+        future.add_done_callback(self._on_models_future_done)
+    
+    def _on_models_future_done(self, future: concurrent.futures.Future):
+        """Queue a finished model refresh for the main thread"""
+        if future.cancelled() or self.closed:
+            return
+        
+        # None marks a failed refresh; the current model list is kept
+        self._post_message(('models_refreshed', None if future.exception() else future.result()))
+    
+    def handle_models_refreshed(self, models: Optional[List[str]]):
+        """Install a background model refresh and update all comboboxes"""
+        self.models_refresh_pending = False
+        if models is None:
+            self.status_var.set("❌ Failed to refresh Ollama models")
+            return
+        
+        # Update all comboboxes only when the list actually changed
+        previous_models = self.model_manager.available_models
+        self.model_manager.set_models(models)
+        if self.model_manager.available_models != previous_models:
+            for combo in self.model_combos.values():
+                combo.configure(values=self.model_manager.available_models)
         
         self.status_var.set(f"🔄 Found {len(self.model_manager.available_models)} Ollama models")
     
@@ -1159,10 +1578,11 @@ class DjinnCouncilGUI:
         
         try:
             # Update djinn roles with selected models
+            available = self.model_manager.available_model_set
             for role_key, model_var in self.model_vars.items():
                 if role_key in self.council.djinn_roles:
                     selected_model = model_var.get()
-                    if selected_model and self.model_manager.is_model_available(selected_model):
+                    if selected_model and selected_model in available:
                         self.council.djinn_roles[role_key].model_name = selected_model
                         
                         # Update the widget with the model information
@@ -1175,7 +1595,7 @@ class DjinnCouncilGUI:
             # Recreate workers with new model assignments
             self.council._initialize_workers()
             
-            # Recreate widgets (this will set models again)
+            # Reconcile widgets with the council (this will set models again)
             self.create_djinn_widgets()
             
             self.status_var.set("⚙️ Configuration applied successfully")
@@ -1186,43 +1606,68 @@ class DjinnCouncilGUI:
     def _start_mystical_progress(self):
         """🌟 Start mystical progress animation"""
         self.progress_active = True
-        self.progress_canvas.delete("all")
+        if not self.mystical_eyecandy:
+            self.progress_bar.start(50)
+            return
+        
+        # Create the orbs and their sparkle trails once - frames only move them
+        if not self.progress_orb_ids:
+            for i in range(5):
+                orb = self.progress_canvas.create_oval(-10, -10, -4, -4,
+                                                       fill='#4A90E2', outline='#7c3aed', width=1)
+                trail = self.progress_canvas.create_oval(-10, -10, -8, -8,
+                                                         fill='#bc8cff', outline='')
+                self.progress_orb_ids.append((orb, trail))
+        else:
+            self.progress_canvas.itemconfigure('all', state='normal')
+        
         self._animate_mystical_progress()
     
     def _stop_mystical_progress(self):
         """⏹️ Stop mystical progress animation"""
         self.progress_active = False
-        self.progress_canvas.delete("all")
+        if not self.mystical_eyecandy:
+            self.progress_bar.stop()
+            return
+        
+        if self.progress_animation_job:
+            self.root.after_cancel(self.progress_animation_job)
+            self.progress_animation_job = None
+        self.progress_canvas.itemconfigure('all', state='hidden')
     
     def _animate_mystical_progress(self):
         """✨ Animate mystical progress with cosmic effects"""
         if not self.progress_active:
             return
-            
-        self.progress_canvas.delete("all")
+        
+        # Back off while the window is minimized or the progress realm is hidden
+        if self.root.state() == 'iconic' or not self.progress_canvas.winfo_ismapped():
+            self.progress_animation_job = self.root.after(200, self._animate_mystical_progress)
+            return
+        
         width = self.progress_canvas.winfo_width()
         height = self.progress_canvas.winfo_height()
         
         if width > 1 and height > 1:
             # Create flowing mystical energy
-            time_offset = time.time() * 3  # Speed multiplier
+            time_offset = time.monotonic() * 3  # Speed multiplier
             
-            for i in range(5):
+            for i, (orb, trail) in enumerate(self.progress_orb_ids):
                 x = (time_offset * 50 + i * 40) % (width + 40) - 20
-                y = height // 2 + math.sin(time_offset + i) * 3
+                y = height // 2 + _SIN_LUT[int((time_offset + i) * _SIN_LUT_SCALE) & (_SIN_LUT_SIZE - 1)] * 3
                 
-                # Create mystical orbs
-                self.progress_canvas.create_oval(x-3, y-3, x+3, y+3, 
-                                               fill='#4A90E2', outline='#7c3aed', width=1)
+                # Move mystical orb
+                self.progress_canvas.coords(orb, x-3, y-3, x+3, y+3)
                 
-                # Add sparkle trail
+                # Move sparkle trail (parked off-canvas until it has room)
                 trail_x = x - 15
                 if trail_x > 0:
-                    self.progress_canvas.create_oval(trail_x-1, y-1, trail_x+1, y+1,
-                                                   fill='#bc8cff', outline='')
+                    self.progress_canvas.coords(trail, trail_x-1, y-1, trail_x+1, y+1)
+                else:
+                    self.progress_canvas.coords(trail, -10, -10, -8, -8)
         
-        # Schedule next animation frame
-        self.root.after(50, self._animate_mystical_progress)
+        # Schedule next animation frame (~30fps)
+        self.progress_animation_job = self.root.after(33, self._animate_mystical_progress)
     
     def invoke_council(self):
         """Invoke the djinn council with the current query"""
@@ -1235,99 +1680,204 @@ class DjinnCouncilGUI:
             messagebox.showerror("Council Error", "Council not initialized.")
             return
         
+        # One invocation at a time - ignore submits while the council is still deliberating
+        if self.council_future is not None and not self.council_future.done():
+            return
+        
+        # Resolve the consensus mode before touching any UI state - Tk variables belong to the main thread
+        consensus_mode = _CONSENSUS_MODE_BY_VALUE.get(self.consensus_var.get())
+        if consensus_mode is None:
+            messagebox.showerror("Consensus Error", f"Unknown consensus mode: {self.consensus_var.get()}")
+            return
+        
         # Disable submit button and start mystical progress
         self.submit_button.config(state='disabled', bg='#374151')
         self._start_mystical_progress()
         self.progress_var.set("🌌 Invoking mystical council... (Models have unlimited contemplation time) 🌌")
         
-        # Set all djinn widgets to thinking state
-        for widget in self.djinn_widgets.values():
-            widget.set_thinking()
+        # Summon all djinn widgets into thinking state with a single redraw
+        with self._batched_tk_updates():
+            for role_key in self.council.djinn_roles:
+                widget = self._get_or_create_djinn_widget(role_key)
+                if widget:
+                    widget.set_thinking()
         
         # Add query to chat history
         self.add_to_chat_history(f"🤔 Your Query: {query}\n", 'user')
         
-        # Start council invocation in separate thread
-        threading.Thread(target=self._invoke_council_thread, args=(query,), daemon=True).start()
+        # Run council invocation on the persistent worker
+        self.council_future = self.council_worker.submit(self._invoke_council_thread, query, consensus_mode)
+        self.council_future.add_done_callback(self._on_council_future_done)
+    
+    def _invoke_council_thread(self, query: str, consensus_mode: ConsensusMode):
+        """Worker function for council invocation"""
+        # Invoke council (no timeout - let models think as long as needed), streaming into the widgets
+        return self.council.invoke_council(query, consensus_mode, timeout=None,
+                                           on_token=self._on_djinn_token,
+                                           on_response=self._on_djinn_response)
+    
+    def _on_djinn_token(self, role: str, text: str):
+        """Queue streamed djinn output for the main thread (called from council workers)"""
+        self._post_message(('token', (role, text)))
+    
+    def _on_djinn_response(self, response: DjinnResponse):
+        """Queue a finished djinn response for the main thread (called from council workers)"""
+        self._post_message(('djinn_done', response))
     
-    def _invoke_council_thread(self, query: str):
-        """Thread function for council invocation"""
+    def _on_council_future_done(self, future: concurrent.futures.Future):
+        """Queue a finished council invocation for the main thread"""
+        if future.cancelled() or self.closed:
+            return
+        
+        error = future.exception()
+        if error is not None:
+            self._post_message(('error', str(error)))
+        else:
+            self._post_message(('session_complete', future.result()))
+    
+    def _post_message(self, message: tuple):
+        """Queue a message for the GUI thread and wake it to drain the queue"""
+        self.response_queue.put(message)
+        if self.closed:
+            return
+        if not self.tk_threaded:
+            return
+        
+        # One pending wake-up covers every message queued before it runs
+        with self._wake_lock:
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+        
+        # Never hold the lock here - event_generate waits for the GUI thread, which takes it too
         try:
-            # Get consensus mode
-            consensus_mode = ConsensusMode(self.consensus_var.get())
-            
-            # Invoke council (no timeout - let models think as long as needed)
-            session = self.council.invoke_council(query, consensus_mode, timeout=None)
-            
-            # Queue results for main thread
-            self.response_queue.put(('session_complete', session))
-            
-        except Exception as e:
-            self.response_queue.put(('error', str(e)))
+            self.root.event_generate('<<CouncilUpdate>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            # Window destroyed, or main loop not running - let the next message try again
+            with self._wake_lock:
+                self._wake_pending = False
     
     def monitor_responses(self):
-        """Monitor response queue and update GUI"""
+        """Drain the response queue and update GUI in one batched pass"""
+        with self._wake_lock:
+            self._wake_pending = False
         try:
-            while True:
-                try:
-                    message_type, data = self.response_queue.get_nowait()
-                    
-                    if message_type == 'session_complete':
-                        self.handle_session_complete(data)
-                    elif message_type == 'error':
-                        self.handle_council_error(data)
-                        
-                except queue.Empty:
-                    break
+            messages = self.response_queue.drain(self.max_messages_per_tick)
+            
+            if messages:
+                self._dispatch_messages(messages)
                     
         except Exception as e:
             print(f"Error monitoring responses: {e}")
         
-        # Schedule next check
-        self.root.after(100, self.monitor_responses)
+        if self.tk_threaded:
+            # Event-driven: producers wake us, only re-arm if a backlog remains
+            with self._wake_lock:
+                rearm = not self.response_queue.empty() and not self._wake_pending
+                if rearm:
+                    self._wake_pending = True
+            if rearm:
+                self.root.after_idle(self.monitor_responses)
+        else:
+            # Tcl without thread support cannot be called from workers - poll instead
+            self.root.after(100, self.monitor_responses)
+    
+    def _fallback_drain(self):
+        """Slow safety tick in case a <<CouncilUpdate>> wake-up was lost"""
+        if not self.response_queue.empty():
+            self.monitor_responses()
+        self.root.after(1000, self._fallback_drain)
+    
+    def _dispatch_messages(self, messages: List[tuple]):
+        """Apply a batch of queued council messages, collapsing duplicate sessions and token runs"""
+        # Keep only the newest completion per session
+        latest_index = {}
+        for index, (message_type, data) in enumerate(messages):
+            if message_type == 'session_complete':
+                latest_index[data.session_id] = index
+        
+        # Streamed tokens are joined per role and written with one insert
+        pending_tokens = {}
+        
+        # Flush all widget changes from this batch in a single redraw
+        with self._batched_tk_updates():
+            for index, (message_type, data) in enumerate(messages):
+                if message_type == 'token':
+                    role, text = data
+                    pending_tokens.setdefault(role, []).append(text)
+                elif message_type == 'djinn_done':
+                    # The final response replaces any stream text still pending for this djinn
+                    pending_tokens.pop(data.role, None)
+                    widget = self._get_or_create_djinn_widget(data.role)
+                    if widget:
+                        widget.set_response(data)
+                elif message_type == 'session_complete':
+                    if latest_index[data.session_id] == index:
+                        self.handle_session_complete(data)
+                elif message_type == 'error':
+                    self.handle_council_error(data)
+                elif message_type == 'models_refreshed':
+                    self.handle_models_refreshed(data)
+            
+            for role, texts in pending_tokens.items():
+                widget = self._get_or_create_djinn_widget(role)
+                if widget:
+                    widget.append_token("".join(texts))
+    
+    @contextlib.contextmanager
+    def _batched_tk_updates(self):
+        """Group state/status updates so Tk redraws once when the outermost batch exits"""
+        self._tk_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._tk_batch_depth -= 1
+            if self._tk_batch_depth == 0:
+                self.root.tk.call('update', 'idletasks')
     
     def handle_session_complete(self, session):
         """Handle completed council session"""
-        # Update djinn response widgets
+        # Update djinn response widgets not already finalized by a streamed 'djinn_done'
         for response in session.djinn_responses:
-            role_key = response.role
-            if role_key in self.djinn_widgets:
-                self.djinn_widgets[role_key].set_response(response)
+            widget = self._get_or_create_djinn_widget(response.role)
+            if widget and widget.current_response is not response:
+                widget.set_response(response)
         
         # Update consensus result
         if session.consensus_result:
-            self.consensus_text.delete(1.0, tk.END)
-            self.consensus_text.insert(tk.END, session.consensus_result.final_response)
+            self._set_consensus_text(session.consensus_result.final_response)
             
             # Add to chat history
             self.add_to_chat_history(f"🌂 Council Decision:\n{session.consensus_result.final_response}\n\n", 'council')
         
-        # Update metrics
-        self.update_metrics_display(session)
-        
-        # Update mystical state and status
-        self.state_var.set("IDLE")
-        self._stop_mystical_progress()
-        self.progress_var.set("✨ Mystical council invocation complete ✨")
-        self.submit_button.config(state='normal', bg='#4A90E2')
-        self.status_var.set(f"Session completed in {session.total_execution_time:.2f}s")
-        
-        # Switch to consensus result tab
-        self.responses_notebook.select(1)
+        # Update metrics only while their tab is showing; otherwise they render when it is opened
+        self._last_session = session
+        if self.metrics_text is not None and self._metrics_tab_visible():
+            self.update_metrics_display(session)
+        
+        # Update mystical state and status, then switch to consensus result tab
+        with self._batched_tk_updates():
+            self.state_var.set("IDLE")
+            self._stop_mystical_progress()
+            self.progress_var.set("✨ Mystical council invocation complete ✨")
+            self.submit_button.config(state='normal', bg='#4A90E2')
+            self.status_var.set(f"Session completed in {session.total_execution_time:.2f}s")
+            self._select_consensus_tab()
     
     def handle_council_error(self, error_msg: str):
         """💥 Handle mystical council invocation error"""
-        self._stop_mystical_progress()
-        self.progress_var.set("💥 Mystical error in the cosmic fabric 💥")
-        self.submit_button.config(state='normal', bg='#4A90E2')
-        self.status_var.set(f"Error: {error_msg}")
-        self.state_var.set("ERROR")
+        with self._batched_tk_updates():
+            self._stop_mystical_progress()
+            self.progress_var.set("💥 Mystical error in the cosmic fabric 💥")
+            self.submit_button.config(state='normal', bg='#4A90E2')
+            self.status_var.set(f"Error: {error_msg}")
+            self.state_var.set("ERROR")
         
         messagebox.showerror("Council Error", f"Council invocation failed: {error_msg}")
     
     def update_metrics_display(self, session):
         """Update metrics display"""
-        metrics_text = f"""🌌 Session Mystical Metrics 🌌
+        parts = [f"""🌌 Session Mystical Metrics 🌌
 =====================================
 
 Session ID: {session.session_id}
@@ -1338,62 +1888,107 @@ Divergence Score: {session.consensus_result.divergence_score:.2f}
 Recursion Depth: {session.recursion_depth}
 
 🎭 Individual Djinn Performance:
-"""
+"""]
         
-        for response in session.djinn_responses:
-            metrics_text += f"  {response.djinn_name}: {response.execution_time:.2f}s (confidence: {response.confidence_score:.2f})\n"
+        parts.extend(f"  {response.djinn_name}: {response.execution_time:.2f}s (confidence: {response.confidence_score:.2f})\n"
+                     for response in session.djinn_responses)
         
         if session.security_events:
-            metrics_text += f"\n🛡️ Security Events:\n"
-            for event in session.security_events:
-                metrics_text += f"  - {event}\n"
+            parts.append("\n🛡️ Security Events:\n")
+            parts.extend(f"  - {event}\n" for event in session.security_events)
+        
+        parts.append("\n🌀 State Transitions:\n")
+        parts.extend(f"  {state.value}: {_format_hms_ms(timestamp)}\n"
+                     for state, timestamp in session.state_history)
         
-        metrics_text += f"\n🌀 State Transitions:\n"
-        for state, timestamp in session.state_history:
-            metrics_text += f"  {state.value}: {timestamp.strftime('%H:%M:%S.%f')[:-3]}\n"
+        metrics_text = "".join(parts)
+        self._metrics_session = session
         
-        self.metrics_text.delete(1.0, tk.END)
-        self.metrics_text.insert(tk.END, metrics_text)
+        # Skip the rewrite when the metrics are unchanged
+        metrics_hash = hash(metrics_text)
+        if metrics_hash == self._last_metrics_hash:
+            return
+        self.metrics_text.config(state='normal')
+        self.metrics_text.replace('1.0', tk.END, metrics_text)
+        self.metrics_text.config(state='disabled')
+        self._last_metrics_hash = metrics_hash
     
     def add_to_chat_history(self, text: str, sender: str):
         """Add text to chat history with formatting"""
-        self.chat_history.config(state='normal')
-        
-        # Add timestamp
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.chat_history.insert(tk.END, f"[{timestamp}] ", 'timestamp')
-        
-        # Add text with color coding
+        # Timestamp, color-coded text and separator go in as one insert
+        segments = [f"[{time.strftime('%H:%M:%S')}] ", 'timestamp']
         if sender == 'user':
-            self.chat_history.insert(tk.END, text, 'user_query')
+            segments += [text, 'user_query']
         elif sender == 'council':
-            self.chat_history.insert(tk.END, text, 'council_response')
+            segments += [text, 'council_response']
+        segments += [_CHAT_SEPARATOR, ()]
+        
+        self.chat_history.config(state='normal')
+        self.chat_history.insert(tk.END, *segments)
+        
+        # Drop the oldest lines so long sessions keep the Text widget bounded
+        line_count = int(self.chat_history.index('end-1c').split('.')[0])
+        if line_count > self.MAX_CHAT_LINES:
+            self.chat_history.delete('1.0', f"{line_count - self.KEEP_CHAT_LINES + 1}.0")
         
-        self.chat_history.insert(tk.END, "\n" + "="*80 + "\n\n")
-        self.chat_history.see(tk.END)
         self.chat_history.config(state='disabled')
+        self._schedule_chat_see()
+    
+    def _schedule_chat_see(self):
+        """Scroll the chat to its end once for a burst of messages"""
+        if self.chat_see_job is None:
+            self.chat_see_job = self.root.after(50, self._chat_see_end)
+    
+    def _chat_see_end(self):
+        """Deferred scroll to the newest chat message"""
+        self.chat_see_job = None
+        self.chat_history.see(tk.END)
     
     def vote_for_djinn_response(self, response: DjinnResponse):
         """Handle voting for a specific djinn response"""
         # Override consensus with voted response
         vote_text = f"👍 MANUAL OVERRIDE - Selected {response.djinn_name}'s Response:\n\n{response.response}"
         
-        self.consensus_text.delete(1.0, tk.END)
-        self.consensus_text.insert(tk.END, vote_text)
+        self._set_consensus_text(vote_text)
         
         self.add_to_chat_history(f"👍 You selected {response.djinn_name}'s response as the final decision.\n", 'user')
         
         # Switch to consensus tab
-        self.responses_notebook.select(1)
+        self._select_consensus_tab()
+    
+    def _set_consensus_text(self, text: str):
+        """Replace the final revelation text, skipping the rewrite when it is unchanged"""
+        text_hash = hash(text)
+        if text_hash == self._last_consensus_hash:
+            return
+        self.consensus_text.config(state='normal')
+        self.consensus_text.replace('1.0', tk.END, text)
+        self.consensus_text.config(state='disabled')
+        self._last_consensus_hash = text_hash
+    
+    def _select_consensus_tab(self):
+        """Bring the final revelation tab forward unless it is already showing"""
+        if self.responses_notebook.index('current') != 1:
+            self.responses_notebook.select(1)
     
     def load_config(self) -> Dict[str, Any]:
-        """Load GUI configuration"""
-        if Path(self.config_file).exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Failed to load config: {e}")
+        """Load GUI configuration (re-parsed only when the file changes on disk)"""
+        config_path = Path(self.config_file)
+        try:
+            mtime = config_path.stat().st_mtime
+            if self._config_cache is not None and mtime == self._config_mtime:
+                return copy.deepcopy(self._config_cache)
+            
+            raw = config_path.read_bytes()
+            self._config_cache = json.loads(raw)
+            self._config_mtime = mtime
+            self._config_hash = hashlib.blake2b(raw).digest()
+            # Callers get their own copy so edits to it never reach the cache
+            return copy.deepcopy(self._config_cache)
+        except FileNotFoundError:
+            pass  # First run - use the defaults
+        except (OSError, ValueError) as e:
+            print(f"Failed to load config: {e}")
         
         return {
             'model_assignments': {},
@@ -1404,15 +1999,26 @@ Recursion Depth: {session.recursion_depth}
     def save_config(self):
         """Save current GUI configuration"""
         config = {
-            'model_assignments': {role: var.get() for role, var in self.model_vars.items()},
+            'model_assignments': dict(self.model_assignments),
             'consensus_mode': self.consensus_var.get(),
             'window_geometry': self.root.geometry()
         }
         
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            self.status_var.set("💾 Configuration saved successfully")
+            raw = json.dumps(config, indent=2).encode()
+            config_hash = hashlib.blake2b(raw).digest()
+            config_path = Path(self.config_file)
+            
+            # Skip the write when the file already holds exactly this configuration
+            if (config_hash == self._config_hash and config_path.exists()
+                    and config_path.stat().st_mtime == self._config_mtime):
+                self.status_var.set("💾 Configuration already up to date")
+            else:
+                _write_bytes_atomic(config_path, raw)
+                self._config_cache = config
+                self._config_mtime = config_path.stat().st_mtime
+                self._config_hash = config_hash
+                self.status_var.set("💾 Configuration saved successfully")
             messagebox.showinfo("Config Saved", f"Configuration saved to {self.config_file}")
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save configuration: {str(e)}")
@@ -1426,16 +2032,20 @@ Recursion Depth: {session.recursion_depth}
         
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    config = json.load(f)
+                config = json.loads(Path(file_path).read_bytes())
                 
-                # Apply loaded configuration
+                # Apply loaded configuration (only touch variables that change)
                 for role, model in config.get('model_assignments', {}).items():
-                    if role in self.model_vars:
-                        self.model_vars[role].set(model)
+                    var = self.model_vars.get(role)
+                    if var is not None and var.get() != model:
+                        var.set(model)
                 
-                if 'consensus_mode' in config:
-                    self.consensus_var.set(config['consensus_mode'])
+                consensus_mode = config.get('consensus_mode')
+                if consensus_mode is not None and consensus_mode not in _CONSENSUS_MODE_BY_VALUE:
+                    messagebox.showwarning("Unknown Consensus Mode",
+                                           f"Ignoring unknown consensus mode '{consensus_mode}' in configuration")
+                elif consensus_mode is not None and self.consensus_var.get() != consensus_mode:
+                    self.consensus_var.set(consensus_mode)
                 
                 self.current_config = config
                 self.status_var.set(f"📁 Configuration loaded from {Path(file_path).name}")
@@ -1449,24 +2059,50 @@ Recursion Depth: {session.recursion_depth}
         if not self.council or not self.council.conversational_memory:
             return
         
-        # Get recent conversation history
-        recent_turns = self.council.conversational_memory.conversation_history[-10:]  # Last 10 turns
+        # Get recent conversation history - last 10 turns, fewer if they are very long
+        recent_turns = _recent_turns_within_budget(self.council.conversational_memory.recent_turns(10),
+                                                   self.HISTORY_CHAR_BUDGET)
         
         if recent_turns:
+            # Banners are appended like any other chat write; turns fill in between them in slices
+            history_banner = "=== Previous Conversation History ===\n\n"
             self.chat_history.config(state='normal')
-            self.chat_history.insert(tk.END, "=== Previous Conversation History ===\n\n", 'mystical')
-            
-            for turn in recent_turns:
-                # Format timestamp
-                time_str = turn.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                self.chat_history.insert(tk.END, f"[{time_str}]\n", 'timestamp')
-                self.chat_history.insert(tk.END, f"🤔 Your Query: {turn.user_query}\n", 'user_query')
-                self.chat_history.insert(tk.END, f"🌂 Council Decision: {turn.council_response}\n\n", 'council_response')
-                self.chat_history.insert(tk.END, "-" * 80 + "\n\n")
-            
-            self.chat_history.insert(tk.END, "=== Current Session ===\n\n", 'mystical')
-            self.chat_history.see(tk.END)
+            banner_start = self.chat_history.index('end-1c')
+            self.chat_history.insert(tk.END, history_banner, 'mystical',
+                                     "=== Current Session ===\n\n", 'mystical')
             self.chat_history.config(state='disabled')
+            self.chat_history.mark_set('history_end', f"{banner_start} + {len(history_banner)} chars")
+            self.chat_history.mark_gravity('history_end', 'right')
+            self._load_history_slice(iter(recent_turns))
+    
+    def _load_history_slice(self, turns):
+        """Insert the next few history turns, then yield to Tk until the next idle slot"""
+        self.history_load_job = None
+        
+        # Build (text, tags) pairs so each slice lands in a single insert
+        segments = []
+        for turn in itertools.islice(turns, self.HISTORY_TURNS_PER_SLICE):
+            segments.extend([
+                f"[{turn.timestamp:%Y-%m-%d %H:%M:%S}]\n", 'timestamp',
+                f"🤔 Your Query: {turn.user_query}\n", 'user_query',
+                f"🌂 Council Decision: {turn.council_response}\n\n", 'council_response',
+                "-" * 80 + "\n\n", ()
+            ])
+        
+        if not segments:
+            self._schedule_chat_see()
+            return
+        
+        self.chat_history.config(state='normal')
+        self.chat_history.insert('history_end', *segments)
+        self.chat_history.config(state='disabled')
+        self.history_load_job = self.root.after_idle(self._load_history_slice, turns)
+    
+    def _cancel_history_load(self):
+        """Stop a history load still in progress"""
+        if self.history_load_job is not None:
+            self.root.after_cancel(self.history_load_job)
+            self.history_load_job = None
     
     def show_memory_stats(self):
         """Show conversational memory statistics"""
@@ -1474,7 +2110,14 @@ Recursion Depth: {session.recursion_depth}
             messagebox.showwarning("No Council", "Council not initialized.")
             return
         
-        memory_stats = self.council.conversational_memory.get_memory_stats()
+        # Reuse the rendered text until the memory changes
+        memory = self.council.conversational_memory
+        cache = self._memory_stats_cache
+        if cache is not None and cache[0] is memory and cache[1] == memory.version:
+            messagebox.showinfo("Memory Statistics", cache[2])
+            return
+        
+        memory_stats = memory.get_memory_stats(topics_limit=5)
         
         stats_text = f"""🧠 Conversational Memory Statistics
 
@@ -1486,10 +2129,10 @@ Recursion Depth: {session.recursion_depth}
 
 🎯 User Profile:
 • Preferred consensus: {memory_stats['preferred_consensus']}
-• Common topics: {', '.join(memory_stats['common_topics'][:5])}
+• Common topics: {', '.join(memory_stats['common_topics'])}
 
 💭 Current Context:
-• Main discussion topics: {', '.join(memory_stats['main_topics'][:5])}
+• Main discussion topics: {', '.join(memory_stats['main_topics'])}
 
 📁 Memory Files:
 • Conversation: {memory_stats['memory_files']['conversation']}
@@ -1503,6 +2146,7 @@ Recursion Depth: {session.recursion_depth}
 • User preference learning: ✅
 """
         
+        self._memory_stats_cache = (memory, memory.version, stats_text)
         messagebox.showinfo("Memory Statistics", stats_text)
     
     def clear_memory_dialog(self):
@@ -1521,6 +2165,7 @@ Recursion Depth: {session.recursion_depth}
         
         if result is True:  # Yes - keep profile
             self.council.conversational_memory.clear_memory(keep_profile=True)
+            self._cancel_history_load()
             self.chat_history.config(state='normal')
             self.chat_history.delete(1.0, tk.END)
             self.chat_history.config(state='disabled')
@@ -1528,6 +2173,7 @@ Recursion Depth: {session.recursion_depth}
             
         elif result is False:  # No - clear everything
             self.council.conversational_memory.clear_memory(keep_profile=False)
+            self._cancel_history_load()
             self.chat_history.config(state='normal')
             self.chat_history.delete(1.0, tk.END)
             self.chat_history.config(state='disabled')
@@ -1538,6 +2184,9 @@ Recursion Depth: {session.recursion_depth}
         try:
             self.root.mainloop()
         finally:
+            self.closed = True
+            self.council_worker.shutdown()
+            self.models_worker.shutdown()
             if self.council:
                 self.council.shutdown()
 
@@ -4,12 +4,16 @@ Test script for Djinn Council GUI components
 """
 
 import sys
-import subprocess
 import json
+import importlib.util
+import urllib.error
+import urllib.request
 from pathlib import Path
 
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+
 def test_imports():
-    """Test that all required modules can be imported"""
+    """Test that all required modules can be found (full imports happen in the tests that use them)"""
     print("🧪 Testing imports...")
     
     try:
@@ -19,18 +23,16 @@ def test_imports():
         print("❌ tkinter - FAILED")
         return False
     
-    try:
-        import ollama
+    if importlib.util.find_spec('ollama') is not None:
         print("✅ ollama - OK") 
-    except ImportError:
+    else:
         print("❌ ollama - FAILED (run: pip install ollama)")
         return False
     
-    try:
-        from advanced_djinn_council import AdvancedDjinnCouncil
+    if importlib.util.find_spec('advanced_djinn_council') is not None:
         print("✅ advanced_djinn_council - OK")
-    except ImportError as e:
-        print(f"❌ advanced_djinn_council - FAILED: {e}")
+    else:
+        print("❌ advanced_djinn_council - FAILED: module not found")
         return False
     
     return True
@@ -40,29 +42,20 @@ def test_ollama_connection():
     print("\n🧪 Testing Ollama connection...")
     
     try:
-        result = subprocess.run(['ollama', 'list'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            models = result.stdout.strip().split('\n')[1:]  # Skip header
-            model_count = len([line for line in models if line.strip()])
-            print(f"✅ Ollama connection - OK ({model_count} models available)")
-            
-            # Show available models
-            print("   Available models:")
-            for line in models:
-                if line.strip():
-                    model_name = line.split()[0]
-                    print(f"     - {model_name}")
-            return True
-        else:
-            print("❌ Ollama connection - FAILED (service not running?)")
-            return False
+        # Ask the Ollama server directly - no CLI process or table parsing
+        with urllib.request.urlopen(OLLAMA_TAGS_URL, timeout=2) as response:
+            data = json.load(response)
+        models = [model['name'] for model in data.get('models', [])]
+        print(f"✅ Ollama connection - OK ({len(models)} models available)")
+        
+        # Show available models
+        print("   Available models:")
+        for model_name in models:
+            print(f"     - {model_name}")
+        return True
             
-    except subprocess.TimeoutExpired:
-        print("❌ Ollama connection - TIMEOUT")
-        return False
-    except FileNotFoundError:
-        print("❌ Ollama connection - NOT INSTALLED")
+    except urllib.error.URLError:
+        print("❌ Ollama connection - FAILED (service not running?)")
         return False
     except Exception as e:
         print(f"❌ Ollama connection - ERROR: {e}")